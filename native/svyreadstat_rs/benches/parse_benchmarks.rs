@@ -20,6 +20,7 @@ fn bench_parse_dta(c: &mut Criterion) {
                     None, // cols_skip
                     None, // n_max
                     0,    // rows_skip
+                    None, // ipc_path
                 );
                 result.unwrap()
             })
@@ -42,6 +43,7 @@ fn bench_parse_dta_with_skip(c: &mut Criterion) {
                     Some(cols_to_skip.clone()),
                     None,
                     0,
+                    None,
                 );
                 result.unwrap()
             })
@@ -65,6 +67,7 @@ fn bench_parse_sav(c: &mut Criterion) {
                     None,  // cols_skip
                     None,  // n_max
                     0,     // rows_skip
+                    None,  // ipc_path
                 );
                 result.unwrap()
             })
@@ -2,11 +2,16 @@
 use anyhow::Result;
 use arrow::array::{ArrayRef, Float64Builder, StringBuilder};
 use arrow::datatypes::{DataType, Field, Schema};
+use arrow::ffi_stream::{ArrowArrayStreamReader, FFI_ArrowArrayStream};
+use arrow::ipc::reader::{FileReader, StreamReader};
 use arrow::ipc::writer::{FileWriter, IpcWriteOptions};
 use arrow::record_batch::RecordBatch;
+use pyo3::prelude::*;
+use pyo3::types::{PyBytes, PyCapsule};
 use serde::Serialize;
 use std::collections::{BTreeMap, HashMap};
 use std::ffi::CStr;
+use std::io::Cursor;
 use std::os::raw::{c_char, c_int, c_void};
 use std::sync::Arc;
 
@@ -490,7 +495,19 @@ pub(crate) unsafe extern "C" fn on_value_label_cb(
     HANDLER_OK
 }
 
-pub(crate) fn finalize_to_ipc(mut ctx: ParseCtx) -> Result<(Vec<u8>, MetaOut)> {
+pub(crate) fn finalize_to_ipc(ctx: ParseCtx) -> Result<(Vec<u8>, MetaOut)> {
+    finalize_into(ctx, Vec::new())
+}
+
+/// Like `finalize_to_ipc`, but writes the IPC file straight to `path`, so the
+/// full payload is never held in memory (nor copied into a Python `bytes`).
+pub(crate) fn finalize_to_ipc_path(ctx: ParseCtx, path: &str) -> Result<MetaOut> {
+    let file = std::fs::File::create(path)?;
+    let (_file, meta) = finalize_into(ctx, file)?;
+    Ok(meta)
+}
+
+fn finalize_into<W: std::io::Write>(mut ctx: ParseCtx, sink: W) -> Result<(W, MetaOut)> {
     use anyhow::anyhow;
 
     let mut fields = Vec::new();
@@ -568,12 +585,13 @@ pub(crate) fn finalize_to_ipc(mut ctx: ParseCtx) -> Result<(Vec<u8>, MetaOut)> {
 
     // Use uncompressed IPC for faster write (if compression isn't needed)
     let write_options = IpcWriteOptions::default();
-    let mut buf = Vec::new();
-    {
-        let mut w = FileWriter::try_new_with_options(&mut buf, &schema, write_options)?;
+    let sink = {
+        let mut w = FileWriter::try_new_with_options(sink, &schema, write_options)?;
         w.write(&batch)?;
         w.finish()?;
-    }
+        // flushes FileWriter's internal buffer and hands the sink back
+        w.into_inner()?
+    };
 
     let vlabels = ctx
         .label_sets
@@ -596,5 +614,53 @@ pub(crate) fn finalize_to_ipc(mut ctx: ParseCtx) -> Result<(Vec<u8>, MetaOut)> {
         notes: ctx.notes,
     };
 
-    Ok((buf, meta))
+    Ok((sink, meta))
+}
+
+/// ---------- Arrow input for the writers ----------
+
+fn ipc_to_batches(buf: &[u8]) -> Result<Vec<RecordBatch>> {
+    let mut batches = Vec::new();
+    if buf.starts_with(b"ARROW1") {
+        let mut fr = FileReader::try_new(Cursor::new(buf), None)?;
+        for b in fr.by_ref() {
+            batches.push(b?);
+        }
+    } else {
+        let mut sr = StreamReader::try_new(Cursor::new(buf), None)?;
+        while let Some(res) = sr.next() {
+            batches.push(res?);
+        }
+    }
+    Ok(batches)
+}
+
+/// Record batches from `data`: Arrow IPC bytes, or any object exporting the Arrow
+/// C stream interface (`__arrow_c_stream__`, e.g. a polars DataFrame), which is
+/// read in place without an IPC encode/decode round trip.
+pub(crate) fn py_to_batches(data: &Bound<'_, PyAny>) -> PyResult<Vec<RecordBatch>> {
+    if let Ok(bytes) = data.downcast::<PyBytes>() {
+        return ipc_to_batches(bytes.as_bytes()).map_err(|e| {
+            pyo3::exceptions::PyRuntimeError::new_err(format!("Arrow IPC decode failed: {}", e))
+        });
+    }
+
+    let obj = data.call_method0("__arrow_c_stream__")?;
+    let capsule = obj.downcast::<PyCapsule>()?;
+    if capsule.name()? != Some(c"arrow_array_stream") {
+        return Err(pyo3::exceptions::PyTypeError::new_err(
+            "__arrow_c_stream__ must return an 'arrow_array_stream' PyCapsule",
+        ));
+    }
+    // SAFETY: the capsule name was checked above, and per the Arrow PyCapsule
+    // interface an "arrow_array_stream" capsule holds an FFI_ArrowArrayStream;
+    // from_raw moves it out and leaves a released stream behind for the capsule
+    // destructor.
+    let stream = capsule.pointer() as *mut FFI_ArrowArrayStream;
+    let reader = unsafe { ArrowArrayStreamReader::from_raw(stream) }.map_err(|e| {
+        pyo3::exceptions::PyRuntimeError::new_err(format!("Arrow C stream import failed: {}", e))
+    })?;
+    reader.collect::<Result<Vec<_>, _>>().map_err(|e| {
+        pyo3::exceptions::PyRuntimeError::new_err(format!("Arrow C stream read failed: {}", e))
+    })
 }
@@ -15,11 +15,12 @@ use readstat_sys::{
 };
 
 use crate::core::{
-    finalize_to_ipc, on_error_cb, on_metadata_cb, on_value_cb, on_value_label_cb, on_variable_cb,
-    ParseCtx,
+    finalize_to_ipc, finalize_to_ipc_path, on_error_cb, on_metadata_cb, on_value_cb,
+    on_value_label_cb, on_variable_cb, ParseCtx,
 };
 
-/// Optimized SAS file parser
+/// Optimized SAS file parser: runs the catalog + data parse and returns the
+/// filled context, ready for `finalize_to_ipc` / `finalize_to_ipc_path`
 ///
 /// Performance optimizations:
 /// - Separate catalog parsing for efficient label loading
@@ -28,13 +29,13 @@ use crate::core::{
 /// - Efficient column skipping
 /// - GIL released during parsing for Python concurrency
 #[inline]
-fn parse_sas_impl(
+fn parse_sas_ctx(
     data_path: &str,
     catalog_path: Option<&str>,
     rows_skip: usize,
     n_max: Option<usize>,
     cols_skip: Option<Vec<String>>,
-) -> Result<(Vec<u8>, crate::core::MetaOut)> {
+) -> Result<ParseCtx> {
     // Pre-calculate skip set for O(1) lookup
     let cols_skip_set = cols_skip.map(|v| {
         let mut map = HashMap::with_capacity(v.len());
@@ -125,8 +126,7 @@ fn parse_sas_impl(
         }
     }
 
-    // Convert to Arrow IPC format
-    finalize_to_ipc(ctx)
+    Ok(ctx)
 }
 
 /// Python interface for parsing SAS files
@@ -139,9 +139,12 @@ fn parse_sas_impl(
 ///   cols_skip: Optional list of column names to skip
 ///   n_max: Optional maximum number of rows to read
 ///   rows_skip: Number of rows to skip from start (default: 0)
+///   ipc_path: Optional path; when given, the Arrow IPC file is written there
+///             instead of being returned as bytes
 ///
 /// Returns:
-///   Tuple of (Arrow IPC bytes, metadata JSON string)
+///   Tuple of (Arrow IPC bytes, metadata JSON string); the bytes are None when
+///   ipc_path is given
 #[pyfunction]
 #[pyo3(signature = (
     data_path,
@@ -150,7 +153,8 @@ fn parse_sas_impl(
     _catalog_encoding=None,
     cols_skip=None,
     n_max=None,
-    rows_skip=0
+    rows_skip=0,
+    ipc_path=None
 ))]
 pub fn df_parse_sas_file<'py>(
     py: Python<'py>,
@@ -161,10 +165,19 @@ pub fn df_parse_sas_file<'py>(
     cols_skip: Option<Vec<String>>,
     n_max: Option<usize>,
     rows_skip: usize,
+    ipc_path: Option<&str>,
 ) -> PyResult<(PyObject, String)> {
-    // Release GIL during parsing for better Python concurrency
-    let result =
-        py.allow_threads(|| parse_sas_impl(data_path, catalog_path, rows_skip, n_max, cols_skip));
+    // Release GIL during parsing (and the IPC write) for better Python concurrency
+    let result = py.allow_threads(|| -> Result<(Option<Vec<u8>>, crate::core::MetaOut)> {
+        let ctx = parse_sas_ctx(data_path, catalog_path, rows_skip, n_max, cols_skip)?;
+        match ipc_path {
+            Some(path) => Ok((None, finalize_to_ipc_path(ctx, path)?)),
+            None => {
+                let (ipc, meta) = finalize_to_ipc(ctx)?;
+                Ok((Some(ipc), meta))
+            }
+        }
+    });
 
     let (ipc, meta) =
         result.map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
@@ -173,8 +186,11 @@ pub fn df_parse_sas_file<'py>(
     let meta_json = serde_json::to_string(&meta)
         .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
 
-    // Return Arrow IPC bytes and metadata
-    let pybytes = PyBytes::new_bound(py, &ipc).into_py(py);
+    // Return Arrow IPC bytes (or None when written to ipc_path) and metadata
+    let pybytes = match ipc {
+        Some(ipc) => PyBytes::new_bound(py, &ipc).into_py(py),
+        None => py.None(),
+    };
     Ok((pybytes, meta_json))
 }
 
@@ -184,7 +200,7 @@ mod tests {
 
     #[test]
     fn test_parse_sas_validates_path() {
-        let result = parse_sas_impl("nonexistent.sas7bdat", None, 0, None, None);
+        let result = parse_sas_ctx("nonexistent.sas7bdat", None, 0, None, None);
         assert!(result.is_err());
     }
 
@@ -192,14 +208,14 @@ mod tests {
     fn test_parse_sas_handles_skip_params() {
         // Test that skip parameters are properly configured
         let cols_skip = Some(vec!["var1".to_string(), "var2".to_string()]);
-        let result = parse_sas_impl("test.sas7bdat", None, 10, Some(50), cols_skip);
+        let result = parse_sas_ctx("test.sas7bdat", None, 10, Some(50), cols_skip);
         // Will fail on nonexistent file, but tests parameter handling
         assert!(result.is_err());
     }
 
     #[test]
     fn test_parse_sas_with_catalog() {
-        let result = parse_sas_impl("test.sas7bdat", Some("test.sas7bcat"), 0, None, None);
+        let result = parse_sas_ctx("test.sas7bdat", Some("test.sas7bcat"), 0, None, None);
         // Will fail on nonexistent files, but tests catalog parameter
         assert!(result.is_err());
     }
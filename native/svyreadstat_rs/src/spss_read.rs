@@ -14,13 +14,24 @@ use readstat_sys::{
 };
 
 use crate::core::{
-    finalize_to_ipc, on_error_cb, on_metadata_cb, on_value_cb, on_value_label_cb, on_variable_cb,
-    ParseCtx,
+    finalize_to_ipc, finalize_to_ipc_path, on_error_cb, on_metadata_cb, on_value_cb,
+    on_value_label_cb, on_variable_cb, ParseCtx,
 };
 
 /// Parse SPSS .sav file
+///
+/// When `ipc_path` is given the Arrow IPC file is written there and None is
+/// returned in place of the IPC bytes.
 #[pyfunction]
-#[pyo3(signature = (path, _encoding=None, _user_na=false, cols_skip=None, n_max=None, rows_skip=0))]
+#[pyo3(signature = (
+    path,
+    _encoding=None,
+    _user_na=false,
+    cols_skip=None,
+    n_max=None,
+    rows_skip=0,
+    ipc_path=None
+))]
 pub fn df_parse_sav_file(
     py: Python<'_>,
     path: &str,
@@ -29,21 +40,39 @@ pub fn df_parse_sav_file(
     cols_skip: Option<Vec<String>>,
     n_max: Option<usize>,
     rows_skip: usize,
+    ipc_path: Option<&str>,
 ) -> PyResult<(PyObject, String)> {
-    // Release GIL during parsing for better Python concurrency
-    let result = py.allow_threads(|| parse_sav_impl(path, cols_skip, n_max, rows_skip));
+    // Release GIL during parsing (and the IPC write) for better Python concurrency
+    let result = py.allow_threads(|| {
+        parse_sav_impl(path, cols_skip, n_max, rows_skip)
+            .and_then(|ctx| finalize_spss(ctx, ipc_path))
+    });
 
     let (ipc, meta) = result?;
     let meta_json = serde_json::to_string(&meta).map_err(|e| {
         pyo3::exceptions::PyRuntimeError::new_err(format!("JSON serialize metadata: {e}"))
     })?;
-    let pybytes = PyBytes::new_bound(py, &ipc).into_py(py);
+    let pybytes = match ipc {
+        Some(ipc) => PyBytes::new_bound(py, &ipc).into_py(py),
+        None => py.None(),
+    };
     Ok((pybytes, meta_json))
 }
 
 /// Parse SPSS portable (.por) file
+///
+/// When `ipc_path` is given the Arrow IPC file is written there and None is
+/// returned in place of the IPC bytes.
 #[pyfunction]
-#[pyo3(signature = (path, _encoding=None, _user_na=false, cols_skip=None, n_max=None, rows_skip=0))]
+#[pyo3(signature = (
+    path,
+    _encoding=None,
+    _user_na=false,
+    cols_skip=None,
+    n_max=None,
+    rows_skip=0,
+    ipc_path=None
+))]
 pub fn df_parse_por_file(
     py: Python<'_>,
     path: &str,
@@ -52,18 +81,37 @@ pub fn df_parse_por_file(
     cols_skip: Option<Vec<String>>,
     n_max: Option<usize>,
     rows_skip: usize,
+    ipc_path: Option<&str>,
 ) -> PyResult<(PyObject, String)> {
-    // Release GIL during parsing for better Python concurrency
-    let result = py.allow_threads(|| parse_por_impl(path, cols_skip, n_max, rows_skip));
+    // Release GIL during parsing (and the IPC write) for better Python concurrency
+    let result = py.allow_threads(|| {
+        parse_por_impl(path, cols_skip, n_max, rows_skip)
+            .and_then(|ctx| finalize_spss(ctx, ipc_path))
+    });
 
     let (ipc, meta) = result?;
     let meta_json = serde_json::to_string(&meta).map_err(|e| {
         pyo3::exceptions::PyRuntimeError::new_err(format!("JSON serialize metadata: {e}"))
     })?;
-    let pybytes = PyBytes::new_bound(py, &ipc).into_py(py);
+    let pybytes = match ipc {
+        Some(ipc) => PyBytes::new_bound(py, &ipc).into_py(py),
+        None => py.None(),
+    };
     Ok((pybytes, meta_json))
 }
 
+/// Write the parsed columns as Arrow IPC: to `ipc_path` when given, else into bytes
+fn finalize_spss(
+    ctx: ParseCtx,
+    ipc_path: Option<&str>,
+) -> PyResult<(Option<Vec<u8>>, crate::core::MetaOut)> {
+    let out = match ipc_path {
+        Some(path) => finalize_to_ipc_path(ctx, path).map(|meta| (None, meta)),
+        None => finalize_to_ipc(ctx).map(|(ipc, meta)| (Some(ipc), meta)),
+    };
+    out.map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("finalize_to_ipc: {e}")))
+}
+
 /// Internal implementation for parsing .sav files
 #[inline]
 fn parse_sav_impl(
@@ -71,7 +119,7 @@ fn parse_sav_impl(
     cols_skip: Option<Vec<String>>,
     n_max: Option<usize>,
     rows_skip: usize,
-) -> PyResult<(Vec<u8>, crate::core::MetaOut)> {
+) -> PyResult<ParseCtx> {
     // Pre-calculate skip set for O(1) lookup
     let cols_skip_map = cols_skip.map(|v| {
         let mut map = HashMap::with_capacity(v.len());
@@ -129,8 +177,7 @@ fn parse_sav_impl(
         }
     }
 
-    finalize_to_ipc(ctx)
-        .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("finalize_to_ipc: {e}")))
+    Ok(ctx)
 }
 
 /// Internal implementation for parsing .por files
@@ -140,7 +187,7 @@ fn parse_por_impl(
     cols_skip: Option<Vec<String>>,
     n_max: Option<usize>,
     rows_skip: usize,
-) -> PyResult<(Vec<u8>, crate::core::MetaOut)> {
+) -> PyResult<ParseCtx> {
     // Pre-calculate skip set for O(1) lookup
     let cols_skip_map = cols_skip.map(|v| {
         let mut map = HashMap::with_capacity(v.len());
@@ -198,6 +245,5 @@ fn parse_por_impl(
         }
     }
 
-    finalize_to_ipc(ctx)
-        .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("finalize_to_ipc: {e}")))
+    Ok(ctx)
 }
@@ -1,12 +1,11 @@
 // native/svyreadstat_rs/src/spss_write.rs
 use anyhow::{anyhow, Result};
 use pyo3::prelude::*;
-use pyo3::types::PyBytes;
 
 use std::collections::HashMap;
 use std::ffi::CString;
 use std::fs::File;
-use std::io::{Cursor, Write as IoWrite};
+use std::io::Write as IoWrite;
 use std::os::raw::c_void;
 use std::path::Path;
 
@@ -22,9 +21,10 @@ use arrow::datatypes::{
     DataType, Int16Type, Int32Type, Int64Type, Int8Type, TimeUnit, UInt16Type, UInt32Type,
     UInt64Type, UInt8Type,
 };
-use arrow::ipc::reader::{FileReader, StreamReader};
 use arrow::record_batch::RecordBatch;
 
+use crate::core::py_to_batches;
+
 use readstat_sys::{
     readstat_add_label_set, readstat_add_variable, readstat_begin_row, readstat_begin_writing_sav,
     readstat_compress_e_READSTAT_COMPRESS_NONE as COMPRESS_NONE,
@@ -57,22 +57,6 @@ unsafe extern "C" fn data_writer_cb(
     }
 }
 
-fn ipc_to_batches(buf: &[u8]) -> Result<Vec<RecordBatch>> {
-    let mut batches = Vec::new();
-    if buf.starts_with(b"ARROW1") {
-        let mut fr = FileReader::try_new(Cursor::new(buf), None)?;
-        for b in fr.by_ref() {
-            batches.push(b?);
-        }
-    } else {
-        let mut sr = StreamReader::try_new(Cursor::new(buf), None)?;
-        while let Some(res) = sr.next() {
-            batches.push(res?);
-        }
-    }
-    Ok(batches)
-}
-
 #[inline]
 fn is_text_dt(dt: &DataType) -> bool {
     matches!(
@@ -591,10 +575,12 @@ fn write_spss_minimal(
     Ok(())
 }
 
+/// Write a .sav file. `data` is Arrow IPC bytes or an object exporting
+/// `__arrow_c_stream__` (see `py_to_batches`).
 #[pyfunction]
-#[pyo3(signature = (ipc_bytes, out_path, file_label=None, compress="byte", var_labels=None, user_missing=None, value_labels=None))]
+#[pyo3(signature = (data, out_path, file_label=None, compress="byte", var_labels=None, user_missing=None, value_labels=None))]
 pub fn df_write_sav_file(
-    ipc_bytes: Bound<'_, PyBytes>,
+    data: Bound<'_, PyAny>,
     out_path: &str,
     file_label: Option<&str>,
     compress: &str,
@@ -602,10 +588,7 @@ pub fn df_write_sav_file(
     user_missing: Option<Vec<HashMap<String, PyObject>>>,
     value_labels: Option<Vec<HashMap<String, PyObject>>>,
 ) -> PyResult<()> {
-    let buf = ipc_bytes.as_bytes();
-    let batches = ipc_to_batches(buf).map_err(|e| {
-        pyo3::exceptions::PyRuntimeError::new_err(format!("Arrow IPC decode failed: {}", e))
-    })?;
+    let batches = py_to_batches(&data)?;
 
     // Convert user_missing from Python-friendly dicts
     let user_missing_converted: Option<Vec<UserMissingInfo>> =
@@ -1,7 +1,7 @@
 // native/svyreadstat_rs/src/stata_read.rs
 use crate::core::{
-    finalize_to_ipc, on_error_cb, on_metadata_cb, on_note_cb, on_value_cb, on_value_label_cb,
-    on_variable_cb, ParseCtx,
+    finalize_to_ipc, finalize_to_ipc_path, on_error_cb, on_metadata_cb, on_note_cb, on_value_cb,
+    on_value_label_cb, on_variable_cb, ParseCtx,
 };
 use anyhow::{anyhow, Result};
 use pyo3::prelude::*;
@@ -14,14 +14,14 @@ use std::os::raw::c_void;
 const RS_OK: readstat_error_t = readstat_error_e_READSTAT_OK;
 const RS_USER_ABORT: readstat_error_t = readstat_error_e_READSTAT_ERROR_USER_ABORT;
 
-/// Parse a Stata .dta file into Arrow IPC format
+/// Parse a Stata .dta file into a filled ParseCtx
 #[inline]
 fn parse_dta_impl(
     data_path: &str,
     rows_skip: usize,
     n_max: Option<usize>,
     cols_skip: Option<Vec<String>>,
-) -> Result<(Vec<u8>, crate::core::MetaOut)> {
+) -> Result<ParseCtx> {
     let mut ctx = ParseCtx {
         cols: Vec::with_capacity(64), // Pre-allocate for typical files
         name_to_idx: HashMap::with_capacity(64),
@@ -72,20 +72,39 @@ fn parse_dta_impl(
         }
     }
 
-    finalize_to_ipc(ctx)
+    Ok(ctx)
 }
 
+/// Write the parsed columns as Arrow IPC: to `ipc_path` when given, else into bytes
+fn finalize_dta(
+    ctx: ParseCtx,
+    ipc_path: Option<&str>,
+) -> Result<(Option<Vec<u8>>, crate::core::MetaOut)> {
+    match ipc_path {
+        Some(path) => finalize_to_ipc_path(ctx, path).map(|meta| (None, meta)),
+        None => finalize_to_ipc(ctx).map(|(ipc, meta)| (Some(ipc), meta)),
+    }
+}
+
+/// Parse a Stata .dta file
+///
+/// When `ipc_path` is given the Arrow IPC file is written there and None is
+/// returned in place of the IPC bytes.
 #[pyfunction]
-#[pyo3(signature = (data_path, cols_skip=None, n_max=None, rows_skip=0))]
+#[pyo3(signature = (data_path, cols_skip=None, n_max=None, rows_skip=0, ipc_path=None))]
 pub fn df_parse_dta_file<'py>(
     py: Python<'py>,
     data_path: &str,
     cols_skip: Option<Vec<String>>,
     n_max: Option<usize>,
     rows_skip: usize,
+    ipc_path: Option<&str>,
 ) -> PyResult<(PyObject, String)> {
-    // Release GIL during parsing for better Python concurrency
-    let result = py.allow_threads(|| parse_dta_impl(data_path, rows_skip, n_max, cols_skip));
+    // Release GIL during parsing (and the IPC write) for better Python concurrency
+    let result = py.allow_threads(|| {
+        parse_dta_impl(data_path, rows_skip, n_max, cols_skip)
+            .and_then(|ctx| finalize_dta(ctx, ipc_path))
+    });
 
     let (ipc, meta) =
         result.map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
@@ -93,6 +112,9 @@ pub fn df_parse_dta_file<'py>(
     let meta_json = serde_json::to_string(&meta)
         .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
 
-    let pybytes = PyBytes::new_bound(py, &ipc).into_py(py);
+    let pybytes = match ipc {
+        Some(ipc) => PyBytes::new_bound(py, &ipc).into_py(py),
+        None => py.None(),
+    };
     Ok((pybytes, meta_json))
 }
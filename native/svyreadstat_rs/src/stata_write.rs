@@ -1,12 +1,11 @@
 // native/svyreadstat_rs/src/stata_write.rs
 use anyhow::{anyhow, Result};
 use pyo3::prelude::*;
-use pyo3::types::PyBytes;
 
 use std::collections::HashMap;
 use std::ffi::CString;
 use std::fs::File;
-use std::io::{Cursor, Write as IoWrite};
+use std::io::Write as IoWrite;
 use std::os::raw::c_void;
 use std::path::Path;
 
@@ -19,9 +18,10 @@ use arrow::datatypes::{
     DataType, Int16Type, Int32Type, Int64Type, Int8Type, UInt16Type, UInt32Type, UInt64Type,
     UInt8Type,
 };
-use arrow::ipc::reader::{FileReader, StreamReader};
 use arrow::record_batch::RecordBatch;
 
+use crate::core::py_to_batches;
+
 use readstat_sys::{
     readstat_add_variable, readstat_begin_row, readstat_begin_writing_dta, readstat_end_row,
     readstat_end_writing, readstat_insert_double_value, readstat_insert_missing_value,
@@ -48,22 +48,6 @@ unsafe extern "C" fn data_writer_cb(
     }
 }
 
-fn ipc_to_batches(buf: &[u8]) -> Result<Vec<RecordBatch>> {
-    let mut batches = Vec::new();
-    if buf.starts_with(b"ARROW1") {
-        let mut fr = FileReader::try_new(Cursor::new(buf), None)?;
-        for b in fr.by_ref() {
-            batches.push(b?);
-        }
-    } else {
-        let mut sr = StreamReader::try_new(Cursor::new(buf), None)?;
-        while let Some(res) = sr.next() {
-            batches.push(res?);
-        }
-    }
-    Ok(batches)
-}
-
 #[inline]
 fn is_text_dt(dt: &DataType) -> bool {
     matches!(
@@ -393,9 +377,11 @@ fn write_stata_minimal(
     Ok(())
 }
 
+/// Write a .dta file. `data` is Arrow IPC bytes or an object exporting
+/// `__arrow_c_stream__` (see `py_to_batches`).
 #[pyfunction]
 #[pyo3(signature = (
-    ipc_bytes,
+    data,
     out_path,
     version,
     file_label=None,
@@ -405,7 +391,7 @@ fn write_stata_minimal(
     _user_missing_json=None
 ))]
 pub fn df_write_dta_file(
-    ipc_bytes: Bound<'_, PyBytes>,
+    data: Bound<'_, PyAny>,
     out_path: &str,
     version: i32,
     file_label: Option<&str>,
@@ -414,10 +400,7 @@ pub fn df_write_dta_file(
     strl_threshold: i32,
     _user_missing_json: Option<&str>,
 ) -> PyResult<()> {
-    let buf = ipc_bytes.as_bytes();
-    let batches = ipc_to_batches(buf).map_err(|e| {
-        pyo3::exceptions::PyRuntimeError::new_err(format!("Arrow IPC decode failed: {}", e))
-    })?;
+    let batches = py_to_batches(&data)?;
 
     let var_labels: Option<HashMap<String, String>> = if let Some(js) = var_labels_json {
         Some(
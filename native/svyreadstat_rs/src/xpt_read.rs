@@ -13,8 +13,8 @@ use readstat_sys::{
 };
 
 use crate::core::{
-    finalize_to_ipc, on_error_cb, on_metadata_cb, on_value_cb, on_value_label_cb, on_variable_cb,
-    ParseCtx,
+    finalize_to_ipc, finalize_to_ipc_path, on_error_cb, on_metadata_cb, on_value_cb,
+    on_value_label_cb, on_variable_cb, ParseCtx,
 };
 
 fn parse_xpt_impl(
@@ -22,7 +22,8 @@ fn parse_xpt_impl(
     rows_skip: usize,
     n_max: Option<usize>,
     cols_skip: Option<Vec<String>>,
-) -> Result<(Vec<u8>, crate::core::MetaOut)> {
+    ipc_path: Option<&str>,
+) -> Result<(Option<Vec<u8>>, crate::core::MetaOut)> {
     let mut ctx = ParseCtx {
         cols: Vec::new(),
         name_to_idx: HashMap::new(),
@@ -68,21 +69,32 @@ fn parse_xpt_impl(
         }
     }
 
-    finalize_to_ipc(ctx)
+    match ipc_path {
+        Some(path) => finalize_to_ipc_path(ctx, path).map(|meta| (None, meta)),
+        None => finalize_to_ipc(ctx).map(|(ipc, meta)| (Some(ipc), meta)),
+    }
 }
 
+/// Parse a SAS transport (.xpt) file
+///
+/// When `ipc_path` is given the Arrow IPC file is written there and None is
+/// returned in place of the IPC bytes.
 #[pyfunction]
-#[pyo3(signature = (data_path, n_max=None, rows_skip=0, cols_skip=None))]
+#[pyo3(signature = (data_path, n_max=None, rows_skip=0, cols_skip=None, ipc_path=None))]
 pub fn df_parse_xpt_file<'py>(
     py: Python<'py>,
     data_path: &str,
     n_max: Option<usize>,
     rows_skip: usize,
     cols_skip: Option<Vec<String>>,
+    ipc_path: Option<&str>,
 ) -> PyResult<(PyObject, String)> {
-    let (ipc, meta) = parse_xpt_impl(data_path, rows_skip, n_max, cols_skip)
+    let (ipc, meta) = parse_xpt_impl(data_path, rows_skip, n_max, cols_skip, ipc_path)
         .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
     let meta_json = serde_json::to_string(&meta).unwrap();
-    let pybytes = PyBytes::new_bound(py, &ipc).into_py(py);
+    let pybytes = match ipc {
+        Some(ipc) => PyBytes::new_bound(py, &ipc).into_py(py),
+        None => py.None(),
+    };
     Ok((pybytes, meta_json))
 }
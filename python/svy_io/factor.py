@@ -6,6 +6,87 @@ from typing import Any, Dict, Optional
 import polars as pl
 
 
+def _py_str(s: pl.Series) -> pl.Series:
+    return pl.Series(s.name, [None if v is None else str(v) for v in s.to_list()], pl.Utf8)
+
+
+def _raw_expr(col: pl.Expr, dtype: pl.DataType) -> pl.Expr:
+    """
+    str(value) for each row, as a Utf8 expression. Integers and strings cast natively
+    to the same text; booleans, floats and temporals render differently in Polars,
+    so those go through Python's str() one batch at a time.
+    """
+    if dtype.is_integer() or dtype in (pl.Utf8, pl.Categorical, pl.Enum):
+        return col.cast(pl.Utf8)
+    if dtype == pl.Boolean:
+        return pl.when(col).then(pl.lit("True")).when(~col).then(pl.lit("False"))
+    return col.map_batches(_py_str, return_dtype=pl.Utf8)
+
+
+def _label_expr(col: pl.Expr, dtype: pl.DataType, mapping: Dict[Any, str]) -> pl.Expr:
+    """
+    Vectorized label lookup: exact (numeric/bool) key match first, else match on
+    str(value). Unlabelled values and nulls map to null.
+    """
+    str_map = {k: v for k, v in mapping.items() if isinstance(k, str)}
+    lab = _raw_expr(col, dtype).replace_strict(str_map, default=None, return_dtype=pl.Utf8)
+
+    # bool keys compare equal to 1/0 (as dict lookups do); NaN keys never match
+    num_keys = {k: v for k, v in mapping.items() if isinstance(k, (int, float)) and k == k}
+    if dtype.is_integer() or dtype == pl.Boolean:
+        # exact Int64 match so large integer codes don't collide through a float cast
+        num_map = {
+            int(k): v
+            for k, v in num_keys.items()
+            if (isinstance(k, int) or k.is_integer()) and -(2**63) <= k < 2**63
+        }
+        num_dtype: pl.DataType = pl.Int64
+    elif dtype.is_numeric():
+        num_map = {float(k): v for k, v in num_keys.items()}
+        num_dtype = pl.Float64
+    else:
+        num_map = {}
+
+    if num_map:
+        # non-strict: values outside Int64 (large UInt64) miss here and use str(value)
+        exact = col.cast(num_dtype, strict=False).replace_strict(
+            num_map, default=None, return_dtype=pl.Utf8
+        )
+        lab = exact.fill_null(lab)
+
+    return lab
+
+
+def _factor_expr(
+    col: pl.Expr, dtype: pl.DataType, mapping: Dict[Any, str], levels: str
+) -> pl.Expr:
+    """
+    Expression form of as_factor for a non-Object column of known dtype, so several
+    columns can be labelled in one with_columns. `levels` must already be validated.
+    """
+    if not mapping or levels == "values":
+        return col.cast(pl.Categorical)
+
+    raw = _raw_expr(col, dtype)
+    lab = _label_expr(col, dtype, mapping)
+
+    if levels == "labels":
+        # Only labels; unlabelled values become null
+        out = lab
+    elif levels == "both":
+        # Prefer label; display as "[raw] label" when labelled, else raw as string
+        out = (
+            pl.when(lab.is_not_null())
+            .then(pl.concat_str([pl.lit("["), raw, pl.lit("] "), lab]))
+            .otherwise(raw)
+        )
+    else:
+        # "default": prefer label where available; otherwise raw value (stringified)
+        out = lab.fill_null(raw)
+
+    return out.cast(pl.Categorical)
+
+
 def as_factor(
     s: pl.Series,
     labels: Optional[Dict[Any, str]] = None,
@@ -27,29 +108,34 @@ def as_factor(
     if levels not in {"default", "labels", "values", "both"}:
         raise ValueError("levels must be one of: default, labels, values, both")
 
-    # No mapping: just categorize the raw values
-    if not mapping:
+    # No mapping, or raw values requested: just categorize the raw values
+    if not mapping or levels == "values":
         return s.cast(pl.Categorical)
 
+    if s.dtype == pl.Object:
+        # Object columns (e.g. hydrated TaggedNA) can't be cast to Utf8 natively
+        return _as_factor_objects(s, mapping, levels)
+
+    return (
+        s.to_frame()
+        .select(_factor_expr(pl.col(s.name), s.dtype, mapping, levels).alias(s.name))
+        .to_series()
+    )
+
+
+def _as_factor_objects(s: pl.Series, mapping: Dict[Any, str], levels: str) -> pl.Series:
     # tolerant lookup: exact match first, else try str(value)
     def _lookup(val: Any) -> Optional[str]:
-        if val is None:
-            return None
         if val in mapping:
             return mapping[val]
         return mapping.get(str(val))
 
-    if levels == "values":
-        # Keep raw values as categories
-        return s.cast(pl.Categorical)
-
+    # One to_list() and one Series build instead of a map_elements round trip per row
+    vals = s.to_list()
     if levels == "labels":
-        # Only labels; unlabelled values become null
-        out = s.map_elements(_lookup)  # -> Optional[str]
-        return out.cast(pl.Utf8).cast(pl.Categorical)
+        out = [None if v is None else _lookup(v) for v in vals]
+    elif levels == "both":
 
-    if levels == "both":
-        # Prefer label; display as "[raw] label" when labelled, else raw as string
         def _both(val: Any) -> Optional[str]:
             if val is None:
                 return None
@@ -57,15 +143,13 @@ def as_factor(
             raw = str(val)
             return f"[{raw}] {lab}" if lab is not None else raw
 
-        out = s.map_elements(_both)
-        return out.cast(pl.Utf8).cast(pl.Categorical)
+        out = [_both(v) for v in vals]
+    else:
+
+        def _default(val: Any) -> str:
+            lab = _lookup(val)
+            return lab if lab is not None else str(val)
 
-    # "default": prefer label where available; otherwise raw value (stringified)
-    def _default(val: Any) -> Optional[str]:
-        if val is None:
-            return None
-        lab = _lookup(val)
-        return lab if lab is not None else str(val)
+        out = [None if v is None else _default(v) for v in vals]
 
-    out = s.map_elements(_default)
-    return out.cast(pl.Utf8).cast(pl.Categorical)
+    return pl.Series(s.name, out, dtype=pl.Utf8).cast(pl.Categorical)
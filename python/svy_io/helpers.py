@@ -1,8 +1,39 @@
 # python/svy_io/helpers.py
 import contextlib
 import os
+import tempfile
+import warnings
 
-from typing import Any
+from typing import Any, Callable, Dict, List, Tuple
+
+import polars as pl
+
+from .tagged_na import _intern_tagged_na
+
+
+# Faster metadata (de)serialization when orjson is available (resolved once at import)
+try:
+    from orjson import OPT_NON_STR_KEYS as _OPT_NON_STR_KEYS  # type: ignore
+    from orjson import dumps as _orjson_dumps  # type: ignore
+    from orjson import loads as _json_loads  # type: ignore
+
+    def _json_dumps(obj: Any) -> str:
+        # non-str keys (integer label codes) are stringified, as json.dumps does
+        return _orjson_dumps(obj, option=_OPT_NON_STR_KEYS).decode()
+
+except ImportError:
+    import json
+
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# Support numpy integer types without requiring numpy (resolved once at import)
+try:
+    import numpy as _np  # type: ignore
+
+    _INT_TYPES: tuple = (int, _np.integer)
+except ImportError:
+    _INT_TYPES = (int,)
 
 
 # ---------------- n_max normalization ----------------
@@ -27,19 +58,10 @@ def _normalize_n_max(n_max: Any) -> int | None:
             raise TypeError("n_max must have length 1")
         n_max = n_max[0]
 
-    # Support numpy integer types without importing numpy unconditionally
-    numpy_int = ()
-    try:
-        import numpy as np  # type: ignore
-
-        numpy_int = (np.integer,)  # type: ignore[attr-defined]
-    except Exception:
-        pass
-
     # Booleans are ints in Python; keep that behavior explicit
     if isinstance(n_max, bool):
         n_max = int(n_max)
-    elif not isinstance(n_max, (int,) + numpy_int):
+    elif not isinstance(n_max, _INT_TYPES):
         raise TypeError("n_max must be an integer")
 
     n_max = int(n_max)
@@ -48,6 +70,208 @@ def _normalize_n_max(n_max: Any) -> int | None:
     return n_max
 
 
+def _empty_meta() -> Dict[str, Any]:
+    """Metadata returned for n_max=0 (the file is never parsed). Fresh on every call."""
+    return {
+        "file_label": None,
+        "vars": [],
+        "value_labels": [],
+        "user_missing": [],
+        "n_rows": 0,
+    }
+
+
+# ---------------- Arrow IPC decoding ----------------
+
+# The IPC *file* format opens with this magic; anything else is treated as a stream.
+_IPC_FILE_MAGIC = b"ARROW1"
+
+
+def _is_ipc_file(buf: bytes) -> bool:
+    return buf[:6] == _IPC_FILE_MAGIC
+
+
+def _parse_via_ipc_file(
+    parse: Callable[..., Tuple[Any, str]], *args: Any
+) -> Tuple[pl.DataFrame, str]:
+    """
+    Run a native parser with ``ipc_path=`` and read back the IPC file it writes there,
+    so the payload is never held twice (Rust buffer + Python bytes) and Polars can map
+    the file rather than copy it. Returns (df, meta_json).
+    """
+    fd, ipc_path = tempfile.mkstemp(suffix=".arrow")
+    os.close(fd)
+    try:
+        _, meta_json = parse(*args, ipc_path=ipc_path)
+        if os.name == "posix":
+            # a live mapping stays valid after unlink
+            df = pl.read_ipc(ipc_path)
+        else:
+            # a mapped file can't be removed on Windows: read it into memory first
+            with open(ipc_path, "rb") as f:
+                df = pl.read_ipc(f)
+    finally:
+        try:
+            os.remove(ipc_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            warnings.warn(
+                f"could not remove temporary file {ipc_path!r}: {e}", RuntimeWarning, stacklevel=2
+            )
+    return df, meta_json
+
+
+# ---------------- metadata index ----------------
+
+
+def _value_label_sets(meta: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+    """
+    {set_name: mapping} over meta["value_labels"]. Built fresh on every call: build it
+    once per operation and pass it down rather than calling it per column.
+    """
+    return {vl["set_name"]: vl["mapping"] for vl in meta.get("value_labels", [])}
+
+
+MetaIndex = Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, str]]]
+
+
+def _compile_meta(meta: Dict[str, Any]) -> MetaIndex:
+    """
+    ({name: var}, {set_name: mapping}) for meta. Nothing is cached on meta: a caller
+    looking up many columns builds this once and passes it as ``compiled=`` to the
+    per-column getters, and rebuilds it after editing meta.
+    """
+    return {v["name"]: v for v in meta.get("vars", [])}, _value_label_sets(meta)
+
+
+def _value_labels_for_column(
+    meta: Dict[str, Any], col_name: str, compiled: MetaIndex | None
+) -> Dict[str, str] | None:
+    """Shared body of the readers' get_value_labels_for_column."""
+    if compiled is not None:
+        vars_by_name, sets = compiled
+        col_info = vars_by_name.get(col_name)
+    else:
+        sets = None
+        col_info = next((v for v in meta.get("vars", []) if v["name"] == col_name), None)
+    if not col_info:
+        return None
+    set_name = col_info.get("label_set")
+    if not set_name:
+        return None
+    if sets is not None:
+        return sets.get(set_name)
+    return next(
+        (vl["mapping"] for vl in meta.get("value_labels", []) if vl["set_name"] == set_name), None
+    )
+
+
+# ---------------- tagged NA hydration ----------------
+
+
+def _by_value_tags(s: pl.Series, by_value: Dict[Any, str]) -> List[Tuple[int, str]]:
+    """(row, tag) for each value of `s` that is a key of `by_value`, mapped natively."""
+    if s.dtype.is_numeric():
+        table = {
+            float(k): t
+            for k, t in by_value.items()
+            if isinstance(k, (int, float)) and not isinstance(k, bool) and k == k
+        }
+        probe = s.cast(pl.Float64)
+    elif s.dtype == pl.Utf8:
+        table = {k: t for k, t in by_value.items() if isinstance(k, str)}
+        probe = s
+    else:
+        # Object and other dtypes: no native hash probe, scan in Python
+        return [(i, t) for i, v in enumerate(s.to_list()) if (t := by_value.get(v)) is not None]
+
+    if not table:
+        return []
+    tags = probe.replace_strict(table, default=None, return_dtype=pl.Utf8)
+    idx = tags.is_not_null().arg_true()
+    return list(zip(idx.to_list(), tags.gather(idx).to_list()))
+
+
+def _tagged_na_updates(s: pl.Series, specs: List[Dict[str, Any]]) -> Dict[int, str]:
+    """
+    Resolve the specs for one column to {row: tag}. Later "rows" specs override
+    earlier ones; "by_value" never re-tags a row that is already tagged.
+    """
+    n = s.len()
+    updates: Dict[int, str] = {}
+    for spec in specs:
+        # A) explicit rows+tags
+        rows, tags = spec.get("rows"), spec.get("tags")
+        if rows and tags and len(rows) == len(tags):
+            for r, t in zip(rows, tags):
+                if 0 <= r < n:
+                    updates[r] = t
+            continue
+
+        # B) value-based mapping
+        by_value = spec.get("by_value")
+        if isinstance(by_value, dict) and by_value:
+            for i, t in _by_value_tags(s, by_value):
+                updates.setdefault(i, t)
+    return updates
+
+
+# Sidecar column holding the tag letters of column X when tagged_na="column"
+_TAG_COLUMN_PREFIX = "__svy_tag_"
+
+
+def _hydrate_tagged_na(
+    df: pl.DataFrame, meta: Dict[str, Any], *, mode: str = "object"
+) -> pl.DataFrame:
+    """
+    Surface the tagged missings described in meta["tagged_missings"].
+
+    Specs are either explicit positions or a value-based mapping:
+        {"col": "x", "rows": [0, 5, 10], "tags": ["a", "b", "a"]}
+        {"col": "x", "by_value": {".A": "A", ".B": "B"}}
+
+    mode="object": tagged cells become TaggedNA objects; only columns that actually
+        change are rebuilt (as Object, since TaggedNA is a Python value).
+    mode="column": values keep their native dtype; each tagged column X gets a
+        Categorical sidecar "__svy_tag_X" with the tag letter (null elsewhere).
+    """
+    if mode not in ("object", "column"):
+        raise ValueError("tagged_na must be one of: object, column")
+
+    specs: List[Dict[str, Any]] = meta.get("tagged_missings") or []
+    if not specs:
+        return df
+
+    # Group specs by column for batch processing
+    columns = set(df.columns)
+    col_specs: Dict[str, List[Dict[str, Any]]] = {}
+    for spec in specs:
+        col = spec.get("col") or spec.get("name")
+        if col and col in columns:
+            col_specs.setdefault(col, []).append(spec)
+
+    replacements: List[pl.Series] = []
+    for col, specs_for_col in col_specs.items():
+        s = df[col]
+        updates = _tagged_na_updates(s, specs_for_col)
+        if not updates:
+            continue
+        if mode == "column":
+            tags = pl.repeat(None, s.len(), dtype=pl.Utf8, eager=True)
+            tags = tags.scatter(list(updates), list(updates.values()))
+            replacements.append(tags.alias(_TAG_COLUMN_PREFIX + col).cast(pl.Categorical))
+            continue
+        # one shared (interned) TaggedNA per distinct tag; instances are immutable
+        na_by_tag = {t: _intern_tagged_na(t) for t in set(updates.values())}
+        vals = s.to_list()
+        for r, t in updates.items():
+            vals[r] = na_by_tag[t]
+        replacements.append(pl.Series(col, vals, dtype=pl.Object))
+
+    return df.with_columns(replacements) if replacements else df
+
+
 @contextlib.contextmanager
 def _as_path(obj):
     """
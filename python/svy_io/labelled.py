@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 import numbers
-import statistics
+import sys
 import warnings
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import polars as pl
 
 
 Value = Union[int, float, str, None]
@@ -14,6 +16,12 @@ Value = Union[int, float, str, None]
 
 # ---------- helpers: typing & validation ----------
 
+# Exact builtin types accepted without walking the numbers.Number ABC machinery;
+# anything else (numpy scalars, Decimal, ...) falls back to the isinstance check.
+_NUMERIC_TYPES = frozenset({int, float})
+_NUMERIC_OR_NONE = frozenset({int, float, type(None)})
+_STR_OR_NONE = frozenset({str, type(None)})
+
 
 def _is_bool(x: Any) -> bool:
     # In Python, bool is a subclass of int; exclude explicitly.
@@ -21,6 +29,8 @@ def _is_bool(x: Any) -> bool:
 
 
 def _is_numeric_scalar(x: Any) -> bool:
+    if type(x) in _NUMERIC_TYPES:
+        return True
     return isinstance(x, numbers.Number) and not _is_bool(x)
 
 
@@ -28,18 +38,37 @@ def _is_char_scalar(x: Any) -> bool:
     return isinstance(x, str)
 
 
-def _is_numeric_seq(seq: Sequence[Any]) -> bool:
-    return all((_is_numeric_scalar(v) or v is None) for v in seq)
+def _is_numeric_seq(seq: Iterable[Any]) -> bool:
+    return all(type(v) in _NUMERIC_OR_NONE or _is_numeric_scalar(v) for v in seq)
+
+
+def _is_string_seq(seq: Iterable[Any]) -> bool:
+    return all(type(v) in _STR_OR_NONE or _is_char_scalar(v) for v in seq)
 
 
-def _is_string_seq(seq: Sequence[Any]) -> bool:
-    return all((_is_char_scalar(v) or v is None) for v in seq)
+# kind -> (sequence check, name used in error messages); resolved once per
+# validation instead of re-branching on the kind for every attribute
+_KIND_CHECKS = {
+    "numeric": (_is_numeric_seq, "numeric"),
+    "string": (_is_string_seq, "character"),
+}
+
+
+def _infer_kind(seq: Sequence[Any]) -> str:
+    """Return "numeric" or "string" for a data sequence (all-None counts as numeric)."""
+    if _is_numeric_seq(seq):
+        return "numeric"
+    if _is_string_seq(seq):
+        return "string"
+    # This rejects bools (TRUE/FALSE) and mixed types.
+    raise TypeError("x must be a numeric or a character vector.")
 
 
 def _ensure_seq(x: Any) -> List[Value]:
     if x is None:
         return []
     if isinstance(x, (list, tuple)):
+        # copy to avoid external mutation
         return list(x)
     # allow a scalar (e.g. 1 -> [1])
     return [x]  # type: ignore[list-item]
@@ -47,7 +76,14 @@ def _ensure_seq(x: Any) -> List[Value]:
 
 def _normalize_labels(
     labels: Optional[Dict[Any, str] | Sequence[Tuple[Any, str]]],
+    *,
+    checked: bool = False,
 ) -> Dict[Any, str]:
+    """
+    Copy labels into a fresh dict. Pass ``checked=True`` when the mapping has
+    already been through _validate_labels_match_data_type, which rejects
+    duplicate codes and names, to skip the uniqueness passes below.
+    """
     if labels is None:
         return {}
 
@@ -64,20 +100,22 @@ def _normalize_labels(
     else:
         raise TypeError("labels must be dict[value->str] or sequence of (value, str) pairs")
 
-    # Haven parity: coded values must be unique (ignoring None)
-    codes = [k for k, _ in items if k is not None]
-    if len(set(codes)) != len(codes):
-        raise ValueError("label codes must be unique")
+    if not checked:
+        # Haven parity: coded values must be unique (ignoring None)
+        codes = [k for k, _ in items if k is not None]
+        if len(set(codes)) != len(codes):
+            raise ValueError("label codes must be unique")
 
-    # Optional: warn (not error) on duplicate label strings
-    names = [v for _, v in items if v is not None]
-    if len(set(names)) != len(names):
-        warnings.warn("duplicate label strings detected; proceeding (haven allows this)")
+        # Optional: warn (not error) on duplicate label strings
+        names = [v for _, v in items if v is not None]
+        if len(set(names)) != len(names):
+            warnings.warn("duplicate label strings detected; proceeding (haven allows this)")
 
-    return dict(items)
+    # Intern label strings: the same label recurs across codes and variables
+    return {k: sys.intern(v) if type(v) is str else v for k, v in items}
 
 
-def _validate_labels_match_data_type(values: List[Value], labels: Dict[Any, str] | None):
+def _validate_labels_match_data_type(kind: str, labels: Dict[Any, str] | None):
     if labels is None:
         return
     if not isinstance(labels, dict):
@@ -85,25 +123,14 @@ def _validate_labels_match_data_type(values: List[Value], labels: Dict[Any, str]
     if not all(isinstance(v, str) for v in labels.values()):
         raise TypeError("labels must have names (string values)")
 
-    if _is_numeric_seq(values):
-        if not all((_is_numeric_scalar(k) or k is None) for k in labels.keys()):
-            raise TypeError("labels must be the same type as data (numeric)")
-    elif _is_string_seq(values):
-        if not all((_is_char_scalar(k) or k is None) for k in labels.keys()):
-            raise TypeError("labels must be the same type as data (character)")
-    else:
-        raise TypeError("x must be a numeric or a character vector.")
+    is_seq, kind_name = _KIND_CHECKS[kind]
+    if not is_seq(labels.keys()):
+        raise TypeError(f"labels must be the same type as data ({kind_name})")
 
-    # keys (coded values) must be unique, ignoring None  (dict guarantees this;
-    # we keep the explicit check for symmetry with haven)
-    keys = [k for k in labels.keys() if k is not None]
-    if len(set(keys)) != len(keys):
-        raise ValueError("labels must be unique")
-
-    # In our orientation (value -> label_string), also ensure label strings
-    # themselves are unique, mirroring haven's "no duplicated codes" constraint.
-    label_names = [nm for nm in labels.values() if nm is not None]
-    if len(set(label_names)) != len(label_names):
+    # Keys (coded values) are unique by virtue of being dict keys. In our
+    # orientation (value -> label_string), also ensure label strings themselves
+    # are unique, mirroring haven's "no duplicated codes" constraint.
+    if len(set(labels.values())) != len(labels):
         raise ValueError("labels must be unique")
 
 
@@ -118,18 +145,23 @@ def _cast_named(values: Optional[Sequence[Value]], target_type: type) -> Optiona
     """Cast values to target type (mimics vec_cast_named from R)"""
     if values is None:
         return None
-    result = []
+    # Dispatch on the target once, then run a single tight loop
+    if target_type is int or target_type is float:
+        if _is_numeric_seq(values):
+            return [None if v is None else target_type(v) for v in values]
+        ok = _is_numeric_scalar
+    elif target_type is str:
+        if _is_string_seq(values):
+            return list(values)
+        ok = _is_char_scalar
+    else:
+        ok = None
+
+    # Type mismatch: report the first offending value
     for v in values:
-        if v is None:
-            result.append(None)
-        elif target_type in (int, float) and _is_numeric_scalar(v):
-            result.append(target_type(v))
-        elif target_type is str and _is_char_scalar(v):
-            result.append(v)
-        else:
-            # Type mismatch
+        if v is not None and (ok is None or not ok(v)):
             raise TypeError(f"Cannot cast {type(v).__name__} to {target_type.__name__}")
-    return result
+    return list(values)
 
 
 def _combine_labels(
@@ -144,13 +176,15 @@ def _combine_labels(
     if not x_labels:
         return y_labels
 
-    # Check for conflicts
-    conflicts = []
-    for code, x_label in x_labels.items():
-        if code in y_labels and y_labels[code] != x_label:
-            conflicts.append(code)
+    # Check for conflicts: intersect the key views (hash join in C), then compare labels
+    conflicts = [c for c in x_labels.keys() & y_labels.keys() if x_labels[c] != y_labels[c]]
 
     if conflicts:
+        if len(conflicts) > 1:
+            # set order is arbitrary; report codes in LHS order
+            order = {c: i for i, c in enumerate(x_labels)}
+            conflicts.sort(key=order.__getitem__)
+
         # Format conflict message
         if len(conflicts) <= 3:
             conflict_str = ", ".join(str(c) for c in conflicts)
@@ -167,10 +201,86 @@ def _combine_labels(
     return x_labels
 
 
+def _all_int64(values: Iterable[Any]) -> bool:
+    """True if every non-None value is a plain int that fits in Int64."""
+    return all(v is None or (type(v) is int and -(2**63) <= v < 2**63) for v in values)
+
+
+def _is_in(s: pl.Series, values: Iterable[Any], numeric: bool) -> pl.Series:
+    """Null-safe membership mask (values cast to the series dtype; Polars won't mix int/float)."""
+    if s.dtype == pl.Int64:
+        keys = [int(v) for v in values]
+    else:
+        keys = [float(v) for v in values] if numeric else list(values)
+    return s.is_in(keys).fill_null(False)
+
+
+def _user_missing_mask(
+    s: pl.Series,
+    numeric: bool,
+    na_set: frozenset,
+    na_range: Optional[Tuple[Value, Value]],
+) -> Optional[pl.Series]:
+    """Mask of values flagged by na_values/na_range (nulls excluded); None if no spec."""
+    mask = _is_in(s, na_set, numeric) if na_set else None
+    if na_range is not None:
+        lo, hi = na_range
+        in_range = s.is_between(lo, hi).fill_null(False)
+        mask = in_range if mask is None else mask | in_range
+    return mask
+
+
+def _check_na_spec(
+    kind: str,
+    na_values: Optional[List[Value]],
+    na_range: Optional[Tuple[Value, Value]],
+) -> Tuple[frozenset, Optional[Tuple[Value, Value]]]:
+    """Validate na_values/na_range against the data kind; return their precompiled forms."""
+    is_seq, kind_name = _KIND_CHECKS[kind]
+
+    # Validate na_values
+    if na_values is not None:
+        if any(v is None for v in na_values):
+            raise ValueError("na_values cannot contain missing values (None)")
+
+        if not is_seq(na_values):
+            raise TypeError(f"na_values must match data type ({kind_name})")
+
+    # Validate na_range
+    if na_range is not None:
+        if len(na_range) != 2:
+            raise ValueError("na_range must be a vector of length two")
+
+        lo, hi = na_range
+        if lo is None or hi is None:
+            raise ValueError("na_range cannot contain missing values (None)")
+
+        if not is_seq((lo, hi)):
+            raise TypeError(f"na_range must match data type ({kind_name})")
+
+        if not (lo < hi):
+            raise ValueError("na_range must be in ascending order")
+
+    # Precompiled forms for the missing-value checks; public attributes stay as given
+    return (
+        frozenset(na_values) if na_values else frozenset(),
+        tuple(na_range) if na_range is not None else None,
+    )
+
+
+def _quantile_sorted(vals: Sequence[float], q: float) -> float:
+    """Linear-interpolation quantile (R type 7, 'inclusive') of already-sorted values."""
+    idx = q * (len(vals) - 1)
+    lo = int(idx)
+    hi = min(lo + 1, len(vals) - 1)
+    frac = idx - lo
+    return float(vals[lo] * (1 - frac) + vals[hi] * frac)
+
+
 # ---------- core classes ----------
 
 
-@dataclass
+@dataclass(slots=True)
 class Labelled:
     """
     Lightweight haven-like labelled vector.
@@ -184,51 +294,88 @@ class Labelled:
     labels: Optional[Dict[Any, str]] = None
     label: Optional[str] = None
 
+    # cached in __post_init__ ("numeric" | "string")
+    _kind: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
     # ---------- validation ----------
     def __post_init__(self):
         self.data = _ensure_seq(self.data)
-        if not (_is_numeric_seq(self.data) or _is_string_seq(self.data)):
-            # This rejects bools (TRUE/FALSE) and mixed types.
-            raise TypeError("x must be a numeric or a character vector.")
+        # Scan the data once; "numeric" | "string" is reused by every type check below
+        self._kind = _infer_kind(self.data)
         _validate_label(self.label)
-        _validate_labels_match_data_type(self.data, self.labels)
+        _validate_labels_match_data_type(self._kind, self.labels)
 
         # normalize labels dict to a copy to avoid external mutation
-        self.labels = _normalize_labels(self.labels)
+        self.labels = _normalize_labels(self.labels, checked=True)
+
+    @classmethod
+    def _unchecked(
+        cls,
+        data: List[Value],
+        labels: Dict[Any, str],
+        label: Optional[str],
+        _kind: str,
+        **kw: Any,
+    ):
+        """Build an instance from already-validated parts, skipping __post_init__."""
+        obj = object.__new__(cls)
+        obj.data = data
+        obj.labels = labels  # shared: normalized labels are immutable by convention
+        obj.label = label
+        obj._kind = _kind
+        for name, value in kw.items():
+            setattr(obj, name, value)
+        return obj
 
     # ---------- basic API ----------
     def as_list(self) -> List[Value]:
         return list(self.data)
 
     def as_character(self) -> List[str]:
+        if self._kind == "string":
+            # already str/None: only missing values need substituting
+            return ["" if v is None else v for v in self.data]
         return ["" if v is None else str(v) for v in self.data]
 
     def levels(self):
         # parity with haven: levels.haven_labelled() -> NULL
         return None
 
+    # ---------- typed buffer ----------
+    def _values(self) -> pl.Series:
+        """Typed column view of data: Float64 for numeric, Utf8 for character (None -> null)."""
+        return pl.Series(self.data, dtype=pl.Float64 if self._kind == "numeric" else pl.Utf8)
+
+    def _exact_values(self, *keys: Iterable[Any]) -> pl.Series:
+        """
+        Like _values(), but Int64 when the data and all comparison keys are plain ints,
+        so codes above 2**53 don't collide through the Float64 view.
+        """
+        if self._kind == "numeric" and all(map(_all_int64, (self.data, *keys))):
+            return pl.Series(self.data, dtype=pl.Int64)
+        return self._values()
+
     # ---------- numeric helpers ----------
-    def _numeric(self) -> List[float]:
-        if not _is_numeric_seq(self.data):
+    def _numeric(self) -> pl.Series:
+        if self._kind != "numeric":
             raise TypeError("Can't compute on labelled<character>.")
-        out: List[float] = []
-        for v in self.data:
-            if v is None:
-                out.append(float("nan"))
-            else:
-                # bools are rejected at validation time; no need to special-case here
-                out.append(float(v))  # type: ignore[arg-type]
-        return out
+        # missing values become NaN (bools are rejected at validation time)
+        return self._values().fill_null(float("nan"))
+
+    def _observed(self) -> pl.Series:
+        """Numeric values with missing (None/NaN) dropped."""
+        return self._numeric().drop_nans()
 
     # ---------- arithmetic (strip class) ----------
     def __add__(self, other):
+        # element-wise on the Float64 buffers; the result stays a plain list
         if isinstance(other, Labelled):
             a = self._numeric()
             b = other._numeric()
-            return [x + y for x, y in zip(a, b)]
+            n = min(len(a), len(b))  # zip semantics: truncate to the shorter side
+            return (a.head(n) + b.head(n)).to_list()
         if isinstance(other, numbers.Number) and not _is_bool(other):
-            a = self._numeric()
-            return [x + float(other) for x in a]
+            return (self._numeric() + float(other)).to_list()
         raise TypeError("incompatible types for addition")
 
     def __radd__(self, other):
@@ -238,9 +385,16 @@ class Labelled:
     def __eq__(self, other):
         if not isinstance(other, Labelled):
             return False
-        return (
-            self.data == other.data and self.labels == other.labels and self.label == other.label
-        )
+        if self is other:
+            return True
+        # cheap discriminators first; the element-wise data compare is O(n)
+        if (
+            len(self.data) != len(other.data)
+            or self.label != other.label
+            or self.labels != other.labels
+        ):
+            return False
+        return self.data == other.data
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -254,8 +408,8 @@ class Labelled:
 
     def __getitem__(self, idx):
         if isinstance(idx, slice):
-            # Return new Labelled with sliced data but same metadata
-            return self.__class__(data=self.data[idx], labels=self.labels, label=self.label)
+            # Return new Labelled with sliced data but same (already validated) metadata
+            return self._unchecked(self.data[idx], self.labels, self.label, self._kind)
         return self.data[idx]
 
     # ---------- repr ----------
@@ -275,37 +429,25 @@ class Labelled:
 
     # ---------- stats ----------
     def median(self):
-        vals = [v for v in self._numeric() if v == v]  # filter NaN
-        if not vals:
+        vals = self._observed()
+        if vals.is_empty():
             return float("nan")
-        return float(statistics.median(vals))
+        return float(vals.median())
 
     def quantile(self, q: float):
         if not (0 <= q <= 1):
             raise ValueError("q must be in [0, 1]")
-        vals = [v for v in self._numeric() if v == v]
-        if not vals:
+        vals = self._observed()
+        if vals.is_empty():
             return float("nan")
-        # R test expects Q1 of [1,2,3] = 1.5 -> use 'inclusive' method
-        qs = statistics.quantiles(vals, n=4, method="inclusive")
-        if q == 0.25:
-            return float(qs[0])
-        if q == 0.5:
-            return float(statistics.median(vals))
-        if q == 0.75:
-            return float(qs[2])
-        # generic linear interpolation across sorted data
-        vals.sort()
-        idx = q * (len(vals) - 1)
-        lo = int(idx)
-        hi = min(lo + 1, len(vals) - 1)
-        frac = idx - lo
-        return float(vals[lo] * (1 - frac) + vals[hi] * frac)
+        # R test expects Q1 of [1,2,3] = 1.5 -> linear ('inclusive', R type 7) interpolation
+        return float(vals.quantile(q, interpolation="linear"))
 
     def summary(self) -> Dict[str, float] | Dict[str, int]:
-        if _is_numeric_seq(self.data):
-            vals = [v for v in self._numeric() if v == v]
-            if not vals:
+        if self._kind == "numeric":
+            # one sort feeds min/max and all three quartiles
+            vals = self._observed().sort()
+            if vals.is_empty():
                 return {
                     "min": float("nan"),
                     "1st_qu.": float("nan"),
@@ -315,18 +457,18 @@ class Labelled:
                     "max": float("nan"),
                 }
             return {
-                "min": float(min(vals)),
-                "1st_qu.": float(self.quantile(0.25)),
-                "median": float(statistics.median(vals)),
-                "mean": float(sum(vals) / len(vals)),
-                "3rd_qu.": float(self.quantile(0.75)),
-                "max": float(max(vals)),
+                "min": float(vals[0]),
+                "1st_qu.": _quantile_sorted(vals, 0.25),
+                "median": _quantile_sorted(vals, 0.5),
+                "mean": float(vals.mean()),
+                "3rd_qu.": _quantile_sorted(vals, 0.75),
+                "max": float(vals[-1]),
             }
         else:
-            return {"length": len(self.data), "na": sum(v is None for v in self.data)}
+            return {"length": len(self.data), "na": self._values().null_count()}
 
 
-@dataclass
+@dataclass(slots=True)
 class LabelledSPSS(Labelled):
     """
     SPSS-specific labelled vector with user-defined missing values.
@@ -339,78 +481,97 @@ class LabelledSPSS(Labelled):
     na_values: Optional[List[Value]] = None
     na_range: Optional[Tuple[Value, Value]] = None
 
-    def __post_init__(self):
-        super().__post_init__()
-
-        # Validate na_values
-        if self.na_values is not None:
-            if any(v is None for v in self.na_values):
-                raise ValueError("na_values cannot contain missing values (None)")
-
-            if _is_numeric_seq(self.data):
-                if not all(_is_numeric_scalar(v) for v in self.na_values):
-                    raise TypeError("na_values must match data type (numeric)")
-            else:
-                if not all(_is_char_scalar(v) for v in self.na_values):
-                    raise TypeError("na_values must match data type (character)")
+    # precompiled in __post_init__
+    _na_values_set: frozenset = field(default=frozenset(), init=False, repr=False, compare=False)
+    _na_range_bounds: Optional[Tuple[Value, Value]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-        # Validate na_range
-        if self.na_range is not None:
-            if len(self.na_range) != 2:
-                raise ValueError("na_range must be a vector of length two")
+    def __post_init__(self):
+        # slots=True re-creates the class, so zero-arg super() can't be used here
+        super(LabelledSPSS, self).__post_init__()
 
-            lo, hi = self.na_range
-            if lo is None or hi is None:
-                raise ValueError("na_range cannot contain missing values (None)")
+        self._na_values_set, self._na_range_bounds = _check_na_spec(
+            self._kind, self.na_values, self.na_range
+        )
 
-            if _is_numeric_seq(self.data):
-                if not (_is_numeric_scalar(lo) and _is_numeric_scalar(hi)):
-                    raise TypeError("na_range must match data type (numeric)")
-            else:
-                if not (_is_char_scalar(lo) and _is_char_scalar(hi)):
-                    raise TypeError("na_range must match data type (character)")
+    @classmethod
+    def from_series(
+        cls,
+        s: pl.Series,
+        labels: Optional[Dict[Any, str]] = None,
+        *,
+        na_values: Optional[List[Value]] = None,
+        na_range: Optional[Tuple[Value, Value]] = None,
+        label: Optional[str] = None,
+    ) -> LabelledSPSS:
+        """
+        Build from a Polars column. The kind comes from the dtype, so the values are
+        not scanned for type checks; they are materialized once for ``data``.
+        """
+        if s.dtype == pl.Utf8:
+            kind = "string"
+        elif s.dtype.is_numeric() or s.dtype == pl.Null:
+            kind = "numeric"
+        else:
+            # e.g. Boolean/Object: let the regular constructor validate (and reject)
+            return cls(
+                data=s.to_list(),
+                labels=labels,
+                label=label,
+                na_values=na_values,
+                na_range=na_range,
+            )
 
-            if not (lo < hi):
-                raise ValueError("na_range must be in ascending order")
+        _validate_label(label)
+        _validate_labels_match_data_type(kind, labels)
+        na_values_set, na_range_bounds = _check_na_spec(kind, na_values, na_range)
+        return cls._unchecked(
+            s.to_list(),
+            _normalize_labels(labels, checked=True),
+            label,
+            kind,
+            na_values=na_values,
+            na_range=na_range,
+            _na_values_set=na_values_set,
+            _na_range_bounds=na_range_bounds,
+        )
 
     def is_na(self) -> List[bool]:
         """Return boolean list indicating which values are missing"""
-        # Start with regular None/NA
-        miss = [v is None for v in self.data]
-
-        # Check na_values
-        if self.na_values is not None:
-            for i, v in enumerate(self.data):
-                if v in self.na_values:
-                    miss[i] = True
+        s = self._exact_values(self._na_values_set, self._na_range_bounds or ())
 
-        # Check na_range
-        if self.na_range is not None:
-            lo, hi = self.na_range
-            for i, v in enumerate(self.data):
-                if v is not None and lo <= v <= hi:
-                    miss[i] = True
+        # Start with regular None/NA, then na_values / inclusive na_range
+        miss = s.is_null()
+        user = _user_missing_mask(
+            s, self._kind == "numeric", self._na_values_set, self._na_range_bounds
+        )
+        if user is not None:
+            miss = miss | user
 
-        return miss
+        return miss.to_list()
 
     def __eq__(self, other):
         if not isinstance(other, LabelledSPSS):
             return False
         return (
-            super().__eq__(other)
-            and self.na_values == other.na_values
+            self.na_values == other.na_values
             and self.na_range == other.na_range
+            and super(LabelledSPSS, self).__eq__(other)
         )
 
     def __getitem__(self, idx):
         if isinstance(idx, slice):
-            # Return new LabelledSPSS with sliced data but same metadata
-            return self.__class__(
-                data=self.data[idx],
-                labels=self.labels,
-                label=self.label,
+            # Return new LabelledSPSS with sliced data but same (already validated) metadata
+            return self._unchecked(
+                self.data[idx],
+                self.labels,
+                self.label,
+                self._kind,
                 na_values=self.na_values,
                 na_range=self.na_range,
+                _na_values_set=self._na_values_set,
+                _na_range_bounds=self._na_range_bounds,
             )
         return self.data[idx]
 
@@ -495,9 +656,10 @@ class LabelledSPSS(Labelled):
     def from_values(cls, values: List[Value], like: LabelledSPSS) -> LabelledSPSS:
         """Create a LabelledSPSS from values, using metadata from 'like'"""
         # Type check
-        if _is_numeric_seq(like.data) and not _is_numeric_seq(values):
-            raise TypeError("Cannot cast non-numeric to numeric labelled")
-        if _is_string_seq(like.data) and not _is_string_seq(values):
+        is_seq, _ = _KIND_CHECKS[like._kind]
+        if not is_seq(values):
+            if like._kind == "numeric":
+                raise TypeError("Cannot cast non-numeric to numeric labelled")
             raise TypeError("Cannot cast non-string to string labelled")
 
         return cls(
@@ -513,42 +675,40 @@ class LabelledSPSS(Labelled):
         Cast this vector to match the type/metadata of template.
         Raises ValueError if cast would lose information.
         """
-
-        # Helper function to check if a value is considered missing
-        def is_missing_in(val, na_values, na_range):
-            if val is None:
-                return False  # None is always missing, handled separately
-            if na_values and val in na_values:
-                return True
-            if na_range:
-                lo, hi = na_range
-                if lo <= val <= hi:
-                    return True
-            return False
-
-        # Check for lossy cast conditions
+        # Check for lossy cast conditions with vectorized masks over the typed buffer;
+        # None is always missing and never counts as lossy.
+        s = self._exact_values(
+            self.labels or (),
+            self._na_values_set,
+            self._na_range_bounds or (),
+            template._na_values_set,
+            template._na_range_bounds or (),
+        )
+        numeric = self._kind == "numeric"
 
         # 1. Check if removing used labels
         if template.labels is not None and self.labels:
-            removed_labels = set(self.labels.keys()) - set(template.labels.keys())
+            removed_labels = self.labels.keys() - template.labels.keys()
+            removed_labels.discard(None)
             if removed_labels:
                 # Check if any data values use the removed labels
-                for val in self.data:
-                    if val in removed_labels:
-                        raise ValueError(
-                            f"Lossy cast: value {val} is labeled in source but not in target"
-                        )
+                used = _is_in(s, removed_labels, numeric)
+                if used.any():
+                    val = self.data[used.arg_true()[0]]
+                    raise ValueError(
+                        f"Lossy cast: value {val} is labeled in source but not in target"
+                    )
 
         # 2. Check if removing used missing value specifications
         # A value that's missing in source must also be missing in target
-        for val in self.data:
-            if val is None:
-                continue  # None is always missing
-
-            source_missing = is_missing_in(val, self.na_values, self.na_range)
-            target_missing = is_missing_in(val, template.na_values, template.na_range)
-
-            if source_missing and not target_missing:
+        source_missing = _user_missing_mask(s, numeric, self._na_values_set, self._na_range_bounds)
+        if source_missing is not None:
+            target_missing = _user_missing_mask(
+                s, numeric, template._na_values_set, template._na_range_bounds
+            )
+            lost = source_missing if target_missing is None else source_missing & ~target_missing
+            if lost.any():
+                val = self.data[lost.arg_true()[0]]
                 raise ValueError(
                     f"Lossy cast: value {val} is user-missing in source but not in target"
                 )
@@ -564,19 +724,19 @@ class LabelledSPSS(Labelled):
 
     def to_int(self) -> List[int]:
         """Convert to integer list"""
-        if not _is_numeric_seq(self.data):
+        if self._kind != "numeric":
             raise TypeError("Cannot convert string labelled to int")
         return [int(v) if v is not None else 0 for v in self.data]
 
     def to_float(self) -> List[float]:
         """Convert to float list"""
-        if not _is_numeric_seq(self.data):
+        if self._kind != "numeric":
             raise TypeError("Cannot convert string labelled to float")
         return [float(v) if v is not None else float("nan") for v in self.data]
 
     def to_str(self) -> List[str]:
         """Convert to string list"""
-        if _is_numeric_seq(self.data):
+        if self._kind == "numeric":
             raise TypeError("Cannot convert numeric labelled to str")
         return [str(v) if v is not None else "" for v in self.data]
 
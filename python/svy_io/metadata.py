@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import sys
+
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class VarMeta:
     name: str
     label: Optional[str]
@@ -12,21 +14,32 @@ class VarMeta:
     fmt: Optional[str]
     kind: str
 
+    def __post_init__(self):
+        # Names recur across metadata (label_set <-> ValueLabels.set_name); intern them
+        if type(self.name) is str:
+            self.name = sys.intern(self.name)
+        if type(self.label_set) is str:
+            self.label_set = sys.intern(self.label_set)
+
 
-@dataclass
+@dataclass(slots=True)
 class ValueLabels:
     set_name: str
     mapping: Dict[str, str]
 
+    def __post_init__(self):
+        if type(self.set_name) is str:
+            self.set_name = sys.intern(self.set_name)
+
 
-@dataclass
+@dataclass(slots=True)
 class MissingRule:
     var: str
     discrete: List[str]
     ranges: List[Tuple[str, str]]
 
 
-@dataclass
+@dataclass(slots=True)
 class SvyMetadata:
     file_label: Optional[str]
     vars: List[VarMeta]
@@ -2,85 +2,39 @@
 from __future__ import annotations
 
 import io
-import json
 import os
+import re
+import shutil
 import tempfile
+import warnings
 import zipfile
 
+from functools import partial
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
 import polars as pl
 import svy_io.svyreadstat_rs as native
 
-from polars.exceptions import ComputeError
-
-from .factor import as_factor
-from .helpers import _normalize_n_max
+from .factor import _factor_expr, as_factor
+from .helpers import (
+    MetaIndex,
+    _empty_meta,
+    _hydrate_tagged_na,
+    _is_ipc_file,
+    _json_loads,
+    _normalize_n_max,
+    _parse_via_ipc_file,
+    _value_label_sets,
+    _value_labels_for_column,
+)
+from .stata import _adjust_temporals
 from .tagged_na import TaggedNA
+from .temporals import coerce_sas_temporals
+from .zap import zap_empty
 
 
-# -------------------- hydrate tagged NA --------------------
-
-
-def _hydrate_tagged_na(df: pl.DataFrame, meta: Dict[str, Any]) -> pl.DataFrame:
-    """
-    Replace specific values in the DataFrame with TaggedNA objects based on metadata.
-
-    SAS supports tagged missing values (.A through .Z and ._), which carry semantic
-    meaning beyond regular missing. This function hydrates those special values.
-
-    The metadata should contain a "tagged_missings" list with specs like:
-    [
-        {
-            "col": "column_name",
-            "rows": [0, 5, 10],  # row indices
-            "tags": ["A", "B", "A"]  # corresponding tags
-        },
-        # OR value-based mapping:
-        {
-            "col": "column_name",
-            "by_value": {
-                ".A": "A",
-                ".B": "B",
-                # Maps special SAS values to tag letters
-            }
-        }
-    ]
-    """
-    specs: List[Dict[str, Any]] = meta.get("tagged_missings") or []
-    if not specs:
-        return df
-
-    out = df
-    for spec in specs:
-        col = spec.get("col") or spec.get("name")
-        if not col or col not in out.columns:
-            continue
-
-        s = out[col]
-
-        # A) explicit rows+tags
-        rows, tags = spec.get("rows"), spec.get("tags")
-        if rows and tags and len(rows) == len(tags):
-            vals = s.cast(pl.Object, strict=False).to_list()
-            for r, t in zip(rows, tags):
-                if 0 <= r < len(vals):
-                    vals[r] = TaggedNA(t)
-            out = out.with_columns(pl.Series(col, vals))
-            continue
-
-        # B) value-based mapping
-        by_value = spec.get("by_value")
-        if isinstance(by_value, dict) and by_value:
-            vals = s.cast(pl.Object, strict=False).to_list()
-            for i, v in enumerate(vals):
-                t = by_value.get(v)
-                if t is not None:
-                    vals[i] = TaggedNA(t)
-            out = out.with_columns(pl.Series(col, vals))
-
-    return out
+# -------------------- tagged NA --------------------
 
 
 def get_tagged_na_info(meta: Dict[str, Any]) -> Dict[str, List[str]]:
@@ -144,6 +98,16 @@ def _as_path_like(obj) -> str:
     raise TypeError("data_path must be a path or a file-like object")
 
 
+_ZIP_COPY_CHUNK = 8 * 1024 * 1024  # large chunks keep decompress -> write throughput up
+
+
+def _extract_member(z: zipfile.ZipFile, member: str, suffix: str) -> str:
+    """Stream one archive member into a fresh temp file and return its path."""
+    with z.open(member) as src, tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as dst:
+        shutil.copyfileobj(src, dst, length=_ZIP_COPY_CHUNK)
+        return dst.name
+
+
 def _maybe_from_zip(path: str) -> tuple[str, str | None]:
     """
     Extract SAS files from a zip archive.
@@ -160,45 +124,46 @@ def _maybe_from_zip(path: str) -> tuple[str, str | None]:
         raise ValueError(f"File {path} is not a valid zip archive")
 
     with zipfile.ZipFile(path) as z:
-        # Find SAS data and catalog files
-        sas_files = [n for n in z.namelist() if n.lower().endswith(".sas7bdat")]
-        cat_files = [n for n in z.namelist() if n.lower().endswith(".sas7bcat")]
+        # Find SAS data and catalog files in one pass over the directory
+        names = z.namelist()
+        sas_files: list[str] = []
+        cat_files: list[str] = []
+        for n in names:
+            ln = n.lower()
+            if ln.endswith(".sas7bdat"):
+                sas_files.append(n)
+            elif ln.endswith(".sas7bcat"):
+                cat_files.append(n)
 
         if not sas_files:
             raise FileNotFoundError(
-                f"Zip file {path} contains no .sas7bdat files. "
-                f"Available files: {', '.join(z.namelist())}"
+                f"Zip file {path} contains no .sas7bdat files. Available files: {', '.join(names)}"
             )
 
         if len(sas_files) > 1:
-            import warnings
-
             warnings.warn(
                 f"Zip file contains {len(sas_files)} .sas7bdat files. "
                 f"Using the first one: {sas_files[0]}",
                 UserWarning,
             )
 
-        # Extract to temp directory
+        # Extract to temp files
         # Note: Using tempfile with delete=False means files persist
         # but are in the system temp dir which gets cleaned periodically
-        temp_base = tempfile.gettempdir()
 
         # Extract data file
-        sas_path = z.extract(sas_files[0], path=temp_base)
+        sas_path = _extract_member(z, sas_files[0], ".sas7bdat")
 
         # Extract catalog file if present
         cat_path = None
         if cat_files:
             if len(cat_files) > 1:
-                import warnings
-
                 warnings.warn(
                     f"Zip file contains {len(cat_files)} .sas7bcat files. "
                     f"Using the first one: {cat_files[0]}",
                     UserWarning,
                 )
-            cat_path = z.extract(cat_files[0], path=temp_base)
+            cat_path = _extract_member(z, cat_files[0], ".sas7bcat")
 
     return sas_path, cat_path
 
@@ -210,10 +175,7 @@ def _build_value_label_lookup(meta: dict) -> dict[str, dict[str, str]]:
     """
     Build {set_name: {value_as_string: label}} from MetaOut.value_labels.
     """
-    out: dict[str, dict[str, str]] = {}
-    for vl in meta.get("value_labels", []):
-        out[vl["set_name"]] = vl["mapping"]
-    return out
+    return _value_label_sets(meta)
 
 
 def _column_label_map(meta: dict) -> dict[str, dict[str, Any]]:
@@ -235,24 +197,19 @@ def get_column_labels(meta: dict) -> dict[str, str | None]:
     """
     Convenience: {col_name: label_or_None}
     """
-    col_meta = _column_label_map(meta)
-    return {k: (v.get("label")) for k, v in col_meta.items()}
+    return {v["name"]: v.get("label") for v in meta.get("vars", [])}
 
 
-def get_value_labels_for_column(meta: dict, col_name: str) -> dict[str, str] | None:
+def get_value_labels_for_column(
+    meta: dict, col_name: str, *, compiled: MetaIndex | None = None
+) -> dict[str, str] | None:
     """
     If the column has a label_set, return its {raw_value_string: human_label} mapping; else None.
-    """
-    col_meta = _column_label_map(meta)
-    lblsets = _build_value_label_lookup(meta)
 
-    info = col_meta.get(col_name)
-    if not info:
-        return None
-    set_name = info.get("label_set")
-    if not set_name:
-        return None
-    return lblsets.get(set_name)
+    Each call scans meta; when looking up many columns, build
+    ``compiled=_compile_meta(meta)`` once (helpers) and pass it for O(1) lookups.
+    """
+    return _value_labels_for_column(meta, col_name, compiled)
 
 
 # ---------------- haven::as_factor analogues (fast, dtype-aware) ----------------
@@ -315,25 +272,14 @@ def as_factor_expr(
         # No labels: cast directly to categorical
         return col_expr.cast(pl.Categorical(ordering="physical" if ordered else "lexical"))
 
-    # Build Utf8 mapping (works regardless of the column's real dtype)
-    mapping_utf8 = pl.DataFrame(
-        {
-            "__svy_key": list(value_labels.keys()),
-            "__svy_label": list(value_labels.values()),
-        }
-    ).with_columns(
-        pl.col("__svy_key").cast(pl.Utf8),
-        pl.col("__svy_label").cast(pl.Utf8),
-    )
+    # Build a Utf8 -> Utf8 mapping directly (works regardless of the column's real dtype)
+    repl = {
+        (k if k is None or isinstance(k, str) else str(k)): (v if v is None else str(v))
+        for k, v in value_labels.items()
+    }
 
     # Compare as strings (avoid Expr.meta.output_type() and pl.datatypes)
     key_expr = col_expr.cast(pl.Utf8)
-    repl = dict(
-        zip(
-            mapping_utf8["__svy_key"].to_list(),
-            mapping_utf8["__svy_label"].to_list(),
-        )
-    )
     label_expr = key_expr.replace(repl)
 
     if levels in {"default", "both"}:
@@ -393,57 +339,127 @@ def as_factor_df(
     return df.with_columns(exprs)
 
 
+_INT_DTYPES = frozenset(
+    {pl.Int8, pl.Int16, pl.Int32, pl.Int64, pl.UInt8, pl.UInt16, pl.UInt32, pl.UInt64}
+)
+_FLOAT_DTYPES = frozenset({pl.Float32, pl.Float64})
+
+
+def _cast_label_keys(mapping: dict, dtype: pl.DataType) -> dict:
+    """
+    Coerce value-label keys to the column dtype; keys that don't convert are kept as-is.
+    The caster is picked once per column rather than per key.
+    """
+    if dtype == pl.Utf8:
+        return {str(k): v for k, v in mapping.items()}
+    if dtype in _INT_DTYPES:
+        caster = int
+    elif dtype in _FLOAT_DTYPES:
+        caster = float
+    else:
+        return mapping
+
+    out = {}
+    for k, v in mapping.items():
+        try:
+            out[caster(k)] = v
+        except (TypeError, ValueError, OverflowError):
+            out[k] = v
+    return out
+
+
 def apply_value_labels(
-    df: pl.DataFrame,
+    df: pl.DataFrame | pl.LazyFrame,
     meta: dict,
     *,
     levels: str = "default",
     ordered: bool = False,
-) -> pl.DataFrame:
-    out = df
-    for col in df.columns:
-        mapping = get_value_labels_for_column(meta, col)
+) -> pl.DataFrame | pl.LazyFrame:
+    # Resolve every column's mapping in one walk of meta rather than once per column
+    col_meta = _column_label_map(meta)
+    lblsets = _build_value_label_lookup(meta)
+    col_to_mapping = {
+        c: lblsets[info["label_set"]]
+        for c, info in col_meta.items()
+        if info.get("label_set") in lblsets
+    }
+
+    levels = levels.lower()
+    if levels not in {"default", "labels", "values", "both"}:
+        raise ValueError("levels must be one of: default, labels, values, both")
+
+    # Expressions for every labelled column go into one plan so Polars can run them
+    # across its thread pool; Object columns (hydrated TaggedNA) need the Python path.
+    # A LazyFrame gets the expressions added to its plan and is returned uncollected.
+    exprs: list[pl.Expr] = []
+    for col, dtype in df.collect_schema().items():
+        mapping = col_to_mapping.get(col)
         if not mapping:
             continue
 
         # optional: coerce mapping keys to match the column dtype
-        dtype = df.schema[col]
-
-        def _cast_key(k):
-            if dtype == pl.Utf8:
-                return str(k)
-            if dtype in (
-                pl.Int8,
-                pl.Int16,
-                pl.Int32,
-                pl.Int64,
-                pl.UInt8,
-                pl.UInt16,
-                pl.UInt32,
-                pl.UInt64,
-            ):
-                try:
-                    return int(k)
-                except Exception:
-                    return k
-            if dtype in (pl.Float32, pl.Float64):
-                try:
-                    return float(k)
-                except Exception:
-                    return k
-            return k
-
-        mapping_cast = {_cast_key(k): v for k, v in mapping.items()}
-
-        out = out.with_columns(
-            as_factor(s=out[col], labels=mapping_cast, levels=levels, ordered=ordered).alias(col)
-        )
-    return out
+        mapping_cast = _cast_label_keys(mapping, dtype)
+
+        if dtype == pl.Object:
+            to_factor = partial(as_factor, labels=mapping_cast, levels=levels, ordered=ordered)
+            exprs.append(pl.col(col).map_batches(to_factor, return_dtype=pl.Categorical))
+        else:
+            exprs.append(_factor_expr(pl.col(col), dtype, mapping_cast, levels).alias(col))
+
+    if not exprs:
+        return df
+    if isinstance(df, pl.LazyFrame):
+        return df.with_columns(exprs)
+    return df.lazy().with_columns(exprs).collect()
 
 
 # ---------------- SAS READERS ----------------
 
 
+# Name patterns used to guess a temporal format when the file carries none
+_DATETIME_NAME_RE = re.compile(r"datetime|timestamp|_dt$")
+_TIME_NAME_RE = re.compile(r"^time$|_time$")
+
+
+def _infer_missing_temporal_fmts(vars_meta: list[dict[str, Any]]) -> None:
+    """Fill in fmt (in place) for variables without one, guessing from the name."""
+    for v in vars_meta:
+        if v.get("fmt"):
+            continue
+        name = (v.get("name") or "").lower()
+        if _DATETIME_NAME_RE.search(name):
+            v["fmt"] = "DATETIME"
+        elif _TIME_NAME_RE.search(name):
+            v["fmt"] = "TIME"
+        elif "date" in name:
+            v["fmt"] = "DATE"
+
+
+def _coerce_temporals(df: pl.DataFrame, meta: dict) -> pl.DataFrame:
+    """
+    Shared temporal post-processing for read_xpt/read_sas: infer missing formats from
+    variable names (recorded in meta), coerce, then make sure DATETIME columns are
+    pl.Datetime (the writer or upstream may have truncated them to Date).
+    """
+    vars_meta = meta.get("vars", [])
+
+    # If SAS formats are missing, infer from variable names so coercion works.
+    _infer_missing_temporal_fmts(vars_meta)
+
+    df = coerce_sas_temporals(df, meta)
+
+    # Only Date columns can need the DATETIME fix; skip the vars walk when there are none
+    date_cols = {name for name, dtype in df.schema.items() if dtype == pl.Date}
+    if not date_cols:
+        return df
+    fixes = [
+        pl.col(v["name"]).cast(pl.Datetime)
+        for v in vars_meta
+        if v.get("name") in date_cols and (v.get("fmt") or "").upper().startswith("DATETIME")
+    ]
+    return df.with_columns(fixes) if fixes else df
+
+
 def read_xpt(
     data_path: str | os.PathLike,
     *,
@@ -454,10 +470,14 @@ def read_xpt(
     factorize: bool = False,
     levels: str = "default",
     ordered: bool = False,
+    tagged_na: str = "object",  # "object" | "column"
 ) -> Tuple[pl.DataFrame, Dict[str, Any]]:
     """
     Read a SAS Transport (XPT) file natively via svyreadstat_rs, returning
     (polars.DataFrame, metadata_dict). No pandas/pyreadstat.
+
+    tagged_na="column" keeps tagged columns in their native dtype and adds a
+    Categorical "__svy_tag_<col>" sidecar instead of Object/TaggedNA cells.
     """
     data_path = os.fspath(data_path)
     n_max = _normalize_n_max(n_max)
@@ -468,59 +488,27 @@ def read_xpt(
             "Implement the XPT reader in the native layer."
         )
 
-    # Native returns Arrow IPC bytes + JSON metadata
-    ipc_bytes, meta_json = native.df_parse_xpt_file(  # type: ignore[attr-defined]
-        data_path, n_max
+    # Native writes the Arrow IPC file to a temp path and returns JSON metadata
+    df, meta_json = _parse_via_ipc_file(
+        native.df_parse_xpt_file,  # type: ignore[attr-defined]
+        data_path,
+        n_max,
     )
 
-    bio = io.BytesIO(ipc_bytes)
-    try:
-        df = pl.read_ipc(bio, memory_map=False)  # Arrow IPC file
-    except ComputeError:
-        bio.seek(0)
-        df = pl.read_ipc_stream(bio)  # Fallback: IPC stream
-
-    meta: Dict[str, Any] = json.loads(meta_json)
+    meta: Dict[str, Any] = _json_loads(meta_json)
 
     # Optional post-processing (same order as read_sas)
     if coerce_temporals:
-        from svy_io.temporals import coerce_sas_temporals  # type: ignore
-
-        # If SAS formats are missing, infer from variable names so coercion works.
-        for v in meta.get("vars", []):
-            if not v.get("fmt"):
-                name = (v.get("name") or "").lower()
-                if "datetime" in name or "timestamp" in name or name.endswith("_dt"):
-                    v["fmt"] = "DATETIME"
-                elif name.endswith("_time") or name == "time":
-                    v["fmt"] = "TIME"
-                elif "date" in name:
-                    v["fmt"] = "DATE"
-
-        df = coerce_sas_temporals(df, meta)
-
-        # Ensure DATETIME columns are actually pl.Datetime (writer may have truncated to Date)
-        fixes: list[pl.Expr] = []
-        for v in meta.get("vars", []):
-            if (
-                (v.get("fmt") or "").upper().startswith("DATETIME")
-                and v.get("name") in df.columns
-                and df.schema.get(v["name"]) == pl.Date
-            ):
-                fixes.append(pl.col(v["name"]).cast(pl.Datetime))
-        if fixes:
-            df = df.with_columns(fixes)
+        df = _coerce_temporals(df, meta)
 
     if zap_empty_str:
-        from svy_io.zap import zap_empty  # type: ignore
-
         df = zap_empty(df)
 
     if factorize:
         df = apply_value_labels(df, meta, levels=levels, ordered=ordered)
 
     # Hydrate tagged NA (harmless for XPT)
-    df = _hydrate_tagged_na(df, meta)
+    df = _hydrate_tagged_na(df, meta, mode=tagged_na)
 
     return df, meta
 
@@ -540,11 +528,16 @@ def read_sas(
     factorize: bool = False,
     levels: str = "default",  # "default" | "labels" | "values" | "both"
     ordered: bool = False,
+    tagged_na: str = "object",  # "object" | "column"
 ) -> Tuple[pl.DataFrame, Dict[str, Any]]:
     """
     Read a SAS7BDAT dataset (optionally with a SAS7BCAT catalog for value labels).
     Supports reading from zip archives containing .sas7bdat files.
 
+    Tagged missings (.A-.Z, ._) come back as TaggedNA objects in an Object column by
+    default; tagged_na="column" keeps the column's native dtype and adds a Categorical
+    "__svy_tag_<col>" sidecar holding the tag letters.
+
     Returns (polars.DataFrame, metadata_dict)
     """
     # Auto-dispatch if an XPT/XPORT path was passed here by mistake
@@ -557,6 +550,7 @@ def read_sas(
             factorize=factorize,
             levels=levels,
             ordered=ordered,
+            tagged_na=tagged_na,
         )
 
     # Validate/normalize n_max first
@@ -564,15 +558,7 @@ def read_sas(
 
     # Fast-path: explicitly requesting zero rows
     if n_max == 0:
-        empty = pl.DataFrame({})
-        meta: Dict[str, Any] = {
-            "file_label": None,
-            "vars": [],
-            "value_labels": [],
-            "user_missing": [],
-            "n_rows": 0,
-        }
-        return empty, meta
+        return pl.DataFrame({}), _empty_meta()
 
     data_path = _as_path_like(data_path)
 
@@ -586,7 +572,8 @@ def read_sas(
     elif catalog_path is not None:
         catalog_path = _as_path_like(catalog_path)
 
-    ipc_bytes, meta_json = native.df_parse_sas_file(  # type: ignore[attr-defined]
+    df, meta_json = _parse_via_ipc_file(
+        native.df_parse_sas_file,  # type: ignore[attr-defined]
         data_path,
         catalog_path,
         encoding,
@@ -596,59 +583,21 @@ def read_sas(
         rows_skip,
     )
 
-    # Robust loader: try FILE first; if footer is missing, use STREAM.
-    bio = io.BytesIO(ipc_bytes)
-    try:
-        df = pl.read_ipc(bio, memory_map=False)
-    except ComputeError as e:
-        if "InvalidFooter" in str(e):
-            bio.seek(0)
-            df = pl.read_ipc_stream(bio)
-        else:
-            raise
-
     # Decode metadata JSON
-    meta: Dict[str, Any] = json.loads(meta_json)
+    meta: Dict[str, Any] = _json_loads(meta_json)
 
     # Optional post-processing (order chosen to mirror typical haven workflows)
     if coerce_temporals:
-        from svy_io.temporals import coerce_sas_temporals  # type: ignore
-
-        # If formats are missing, infer from variable names so coercion works.
-        for v in meta.get("vars", []):
-            if not v.get("fmt"):
-                name = (v.get("name") or "").lower()
-                if "datetime" in name or "timestamp" in name or name.endswith("_dt"):
-                    v["fmt"] = "DATETIME"
-                elif name.endswith("_time") or name == "time":
-                    v["fmt"] = "TIME"
-                elif "date" in name:
-                    v["fmt"] = "DATE"
-
-        df = coerce_sas_temporals(df, meta)
-
-        # Ensure DATETIME columns are actually pl.Datetime (in case upstream truncated)
-        fixes: list[pl.Expr] = []
-        for v in meta.get("vars", []):
-            if (
-                (v.get("fmt") or "").upper().startswith("DATETIME")
-                and v.get("name") in df.columns
-                and df.schema.get(v["name"]) == pl.Date
-            ):
-                fixes.append(pl.col(v["name"]).cast(pl.Datetime))
-        if fixes:
-            df = df.with_columns(fixes)
+        df = _coerce_temporals(df, meta)
 
     if zap_empty_str:
-        from svy_io.zap import zap_empty  # type: ignore
-
         df = zap_empty(df)
 
     if factorize:
         df = apply_value_labels(df, meta, levels=levels, ordered=ordered)
 
     # Hydrate tagged NA
-    df = _hydrate_tagged_na(df, meta)
+    df = _hydrate_tagged_na(df, meta, mode=tagged_na)
 
     return df, meta
 
@@ -671,34 +620,22 @@ def read_sas_arrow(
     import pyarrow as pa
     import pyarrow.ipc as pa_ipc
 
-    from pyarrow import ArrowInvalid
-
     n_max = _normalize_n_max(n_max)
     if n_max == 0:
         # empty table with no fields; keep behavior consistent
         empty = pa.table({})
-        meta = {
-            "file_label": None,
-            "vars": [],
-            "value_labels": [],
-            "user_missing": [],
-            "n_rows": 0,
-        }
-        return empty, meta
+        return empty, _empty_meta()
 
     ipc_bytes, meta_json = native.df_parse_sas_file(  # type: ignore[attr-defined]
         data_path, catalog_path, encoding, catalog_encoding, cols_skip, n_max, rows_skip
     )
 
-    bio = io.BytesIO(ipc_bytes)
-    # Use FileReader first (Rust likely wrote a file IPC); fallback to stream
-    try:
-        table = pa_ipc.open_file(bio).read_all()
-    except ArrowInvalid:  # type: ignore[attr-defined]
-        bio.seek(0)
-        table = pa_ipc.open_stream(bio).read_all()
+    # Zero-copy C++ reader over the bytes; BytesIO would go through Python-level reads
+    src = pa.BufferReader(pa.py_buffer(ipc_bytes))
+    reader = pa_ipc.open_file(src) if _is_ipc_file(ipc_bytes) else pa_ipc.open_stream(src)
+    table = reader.read_all()
 
-    meta = json.loads(meta_json)
+    meta = _json_loads(meta_json)
     return table, meta
 
 
@@ -720,11 +657,6 @@ def write_xpt(
     Primary path: svyreadstat_rs.df_write_xpt_file (Arrow IPC).
     Fallback (if native fails or writes 0 bytes): pyreadstat.write_xport().
     """
-    import io
-    import os
-
-    from pathlib import Path
-
     # Normalize path to str (PyO3 expects str)
     path = os.fspath(path)
 
@@ -745,18 +677,12 @@ def write_xpt(
         raise ValueError(f"label must be <= 40 characters, got {len(label)}")
 
     # --- XPT requires numeric == double; make that explicit ---
-    int_cols = [
-        c
-        for c, dt in df.schema.items()
-        if dt in (pl.Int8, pl.Int16, pl.Int32, pl.Int64, pl.UInt8, pl.UInt16, pl.UInt32, pl.UInt64)
-    ]
+    int_cols = [c for c, dt in df.schema.items() if dt in _INT_DTYPES]
     if int_cols:
         df = df.with_columns([pl.col(c).cast(pl.Float64) for c in int_cols])
 
     # Temporal adjustment (mirrors haven's adjust_tz behavior)
     if adjust_tz:
-        from .stata import _adjust_temporals
-
         df = _adjust_temporals(df, adjust_tz=True)
 
     # --- Try the native writer first ---
@@ -770,32 +696,11 @@ def write_xpt(
             label=label,
         )
 
-    # Build Arrow IPC **file** bytes, then retry with **stream** if footer complaints show up.
-    try:
-        bio_file = io.BytesIO()
-        df.write_ipc(bio_file)  # file format, includes footer
-        _try_native(bio_file.getvalue())
-    except RuntimeError as e:
-        msg = str(e)
-        if "InvalidFooter" in msg or "correct footer" in msg or "footer" in msg:
-            # Native likely expects a stream – retry with stream bytes
-            bio_stream = io.BytesIO()
-            try:
-                df.write_ipc_stream(bio_stream)
-                _try_native(bio_stream.getvalue())
-            except AttributeError:
-                # Very old Polars: stream via PyArrow
-                import pyarrow as pa
-                import pyarrow.ipc as pa_ipc
-
-                table = df.to_arrow()
-                sink = pa.BufferOutputStream()
-                with pa_ipc.new_stream(sink, table.schema) as writer:
-                    writer.write_table(table)
-                _try_native(sink.getvalue().to_pybytes())
-        else:
-            # Some other native error—bubble up to the fallback
-            raise
+    # df_write_xpt_file decodes with an Arrow IPC FileReader, so encode the
+    # **file** format exactly once; a stream-format retry could never succeed.
+    bio_file = io.BytesIO()
+    df.write_ipc(bio_file)  # file format, includes footer
+    _try_native(bio_file.getvalue())
 
     # If we got here without exception but the file is empty, the native layer didn't finalize.
     if os.path.exists(path) and os.stat(path).st_size == 0:
@@ -828,8 +733,6 @@ def write_sas(df: pl.DataFrame, path: str | Path) -> None:
     """
     Write SAS7BDAT file (DEPRECATED - use write_xpt instead).
     """
-    import warnings
-
     warnings.warn(
         "write_sas() is deprecated and produces files that SAS cannot read. "
         "Use write_xpt() instead for reliable SAS-compatible output.",
@@ -2,63 +2,93 @@
 from __future__ import annotations
 
 import io
-import json
 import os
+import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import polars as pl
 import svy_io.svyreadstat_rs as native
-from polars.exceptions import ComputeError
 
-from .helpers import _normalize_n_max, _as_path
-from .labelled import LabelledSPSS, labelled_spss
+from .helpers import (
+    MetaIndex,
+    _as_path,
+    _empty_meta,
+    _json_loads,
+    _normalize_n_max,
+    _parse_via_ipc_file,
+    _value_label_sets,
+    _value_labels_for_column,
+)
+from .labelled import LabelledSPSS
+from .stata import _adjust_temporals
+from .temporals import coerce_spss_temporals
+from .zap import zap_empty
 
 
 # -------------------- User-defined missing integration --------------------
 
 
+def _numeric_label_keys(value_labels: Dict[str, str]) -> Dict[Any, str]:
+    """Label-set keys as numbers (int when integral) for numeric columns."""
+    converted_labels: Dict[Any, str] = {}
+    for k, v in value_labels.items():
+        try:
+            num_key = float(k)
+            if num_key == int(num_key):
+                num_key = int(num_key)
+            converted_labels[num_key] = v
+        except (ValueError, TypeError, OverflowError):
+            converted_labels[k] = v
+    return converted_labels
+
+
 def _apply_user_missing_to_column(
-    values: List[Any],
+    s: pl.Series,
     var_meta: Dict[str, Any],
-    value_labels: Optional[Dict[str, str]],
+    value_labels: Optional[Dict[Any, str]],
 ) -> LabelledSPSS:
-    """Convert a column to LabelledSPSS if it has user-defined missing values."""
+    """
+    Convert a column to LabelledSPSS if it has user-defined missing values.
+    value_labels must already have keys matching the column type (_numeric_label_keys).
+    """
     user_miss = var_meta.get("user_missing")
     if not user_miss:
-        return labelled_spss(values, labels=value_labels, label=var_meta.get("label"))
+        return LabelledSPSS.from_series(s, value_labels, label=var_meta.get("label"))
 
     na_values = user_miss.get("values")
     na_range_list = user_miss.get("range")
     na_range = tuple(na_range_list) if na_range_list and len(na_range_list) == 2 else None
 
-    # Convert value_labels keys to match data type
-    if (
-        value_labels
-        and values
-        and isinstance(values[0], (int, float))
-        and not isinstance(values[0], bool)
-    ):
-        converted_labels: Dict[Any, str] = {}
-        for k, v in value_labels.items():
-            try:
-                num_key = float(k)
-                if num_key == int(num_key):
-                    num_key = int(num_key)
-                converted_labels[num_key] = v
-            except (ValueError, TypeError):
-                converted_labels[k] = v
-        value_labels = converted_labels
-
-    return labelled_spss(
-        values,
-        labels=value_labels,
+    return LabelledSPSS.from_series(
+        s,
+        value_labels,
         na_values=na_values,
         na_range=na_range,
         label=var_meta.get("label"),
     )
 
 
+def _na_values_mask(col: pl.Expr, na_values: Optional[List[Any]]) -> Optional[pl.Expr]:
+    if not na_values:
+        return None
+    # a single code is a plain comparison rather than an is_in lookup
+    return col == na_values[0] if len(na_values) == 1 else col.is_in(na_values)
+
+
+def _na_range_mask(col: pl.Expr, na_range: Optional[List[Any]]) -> Optional[pl.Expr]:
+    if not na_range or len(na_range) != 2:
+        return None
+    low, high = na_range
+    if low is not None and high is not None:
+        return col.is_between(low, high)
+    if low is not None:
+        return col >= low
+    if high is not None:
+        return col <= high
+    return None
+
+
 def _hydrate_user_missing(
     df: pl.DataFrame,
     meta: Dict[str, Any],
@@ -70,24 +100,30 @@ def _hydrate_user_missing(
     If user_na=False: Convert to None/null (vectorized).
     If user_na=True: Create LabelledSPSS objects recorded in meta["labelled_columns"].
     """
-    # Build value label lookup once
-    value_label_sets = {vl["set_name"]: vl["mapping"] for vl in meta.get("value_labels", [])}
+    # Most files declare no user missings: find the vars that do in one pass and
+    # skip all the per-variable work below when there are none
+    columns = set(df.columns)
+    specs = [v for v in meta.get("vars", []) if v.get("user_missing") and v["name"] in columns]
 
     if user_na:
         labelled_columns: Dict[str, LabelledSPSS] = {}
         user_missing_list = []
+        value_label_sets = _value_label_sets(meta) if specs else {}
+        # Label sets are often shared by many columns: convert keys once per set
+        numeric_sets: Dict[str, Dict[Any, str]] = {}
 
-        for var in meta.get("vars", []):
+        for var in specs:
             col_name = var["name"]
-            if col_name not in df.columns or not var.get("user_missing"):
-                continue
-
             user_miss = var["user_missing"]
+            s = df[col_name]
             label_set = var.get("label_set")
             value_labels = value_label_sets.get(label_set) if label_set else None
+            if value_labels and s.dtype.is_numeric():
+                if label_set not in numeric_sets:
+                    numeric_sets[label_set] = _numeric_label_keys(value_labels)
+                value_labels = numeric_sets[label_set]
 
-            values = df[col_name].to_list()
-            labelled_col = _apply_user_missing_to_column(values, var, value_labels)
+            labelled_col = _apply_user_missing_to_column(s, var, value_labels)
             labelled_columns[col_name] = labelled_col
 
             # Build missing spec
@@ -100,44 +136,29 @@ def _hydrate_user_missing(
 
         meta["labelled_columns"] = labelled_columns
         meta["user_missing"] = user_missing_list
-    else:
+    elif specs:
         # Vectorized conversion to null
         replacements = []
 
-        for var in meta.get("vars", []):
+        for var in specs:
             col_name = var["name"]
-            if col_name not in df.columns:
-                continue
-
-            user_miss = var.get("user_missing")
-            if not user_miss:
-                continue
-
+            user_miss = var["user_missing"]
             na_values = user_miss.get("values", [])
             na_range = user_miss.get("range")
 
-            if not na_values and not na_range:
-                continue
-
             col = pl.col(col_name)
-            conditions = []
-
-            if na_values:
-                conditions.append(col.is_in(na_values))
-
-            if na_range and len(na_range) == 2:
-                low, high = na_range
-                if low is not None and high is not None:
-                    conditions.append((col >= low) & (col <= high))
-                elif low is not None:
-                    conditions.append(col >= low)
-                elif high is not None:
-                    conditions.append(col <= high)
-
-            if conditions:
-                mask = conditions[0]
-                for cond in conditions[1:]:
-                    mask = mask | cond
+            values_mask = _na_values_mask(col, na_values)
+            range_mask = _na_range_mask(col, na_range)
+
+            # Values-only and range-only are the common cases; combine only when both
+            if values_mask is None:
+                mask = range_mask
+            elif range_mask is None:
+                mask = values_mask
+            else:
+                mask = pl.any_horizontal(values_mask, range_mask)
+
+            if mask is not None:
                 replacements.append(pl.when(mask).then(None).otherwise(col).alias(col_name))
 
         if replacements:
@@ -150,7 +171,7 @@ def _hydrate_user_missing(
 
 
 def _build_value_label_lookup(meta: dict) -> dict[str, dict[str, str]]:
-    return {vl["set_name"]: vl["mapping"] for vl in meta.get("value_labels", [])}
+    return _value_label_sets(meta)
 
 
 def _column_label_map(meta: dict) -> dict[str, dict[str, Any]]:
@@ -169,16 +190,10 @@ def get_column_labels(meta: dict) -> dict[str, str | None]:
     return {v["name"]: v.get("label") for v in meta.get("vars", [])}
 
 
-def get_value_labels_for_column(meta: dict, col_name: str) -> dict[str, str] | None:
-    col_info = next((v for v in meta.get("vars", []) if v["name"] == col_name), None)
-    if not col_info:
-        return None
-    set_name = col_info.get("label_set")
-    if not set_name:
-        return None
-    return next(
-        (vl["mapping"] for vl in meta.get("value_labels", []) if vl["set_name"] == set_name), None
-    )
+def get_value_labels_for_column(
+    meta: dict, col_name: str, *, compiled: MetaIndex | None = None
+) -> dict[str, str] | None:
+    return _value_labels_for_column(meta, col_name, compiled)
 
 
 def get_user_missing_for_column(meta: dict, col_name: str) -> dict[str, Any] | None:
@@ -189,6 +204,14 @@ def get_user_missing_for_column(meta: dict, col_name: str) -> dict[str, Any] | N
 # ---------------- Name normalization ----------------
 
 
+_NAME_TRANS = str.maketrans({".": "_", " ": "_", "-": "_"})
+_UNDERSCORE_RUN = re.compile(r"_+")
+
+
+def _normalize_name(name: str) -> str:
+    return _UNDERSCORE_RUN.sub("_", name.strip().lower().translate(_NAME_TRANS)).strip("_")
+
+
 def _normalize_names(
     df: pl.DataFrame, meta: Dict[str, Any]
 ) -> tuple[pl.DataFrame, Dict[str, Any]]:
@@ -199,27 +222,19 @@ def _normalize_names(
     - replace dots/spaces/dashes with underscores
     - collapse multiple underscores
     """
-    rename: Dict[str, str] = {}
-
-    for c in df.columns:
-        nc = c.strip().lower().replace(".", "_").replace(" ", "_").replace("-", "_")
-        while "__" in nc:
-            nc = nc.replace("__", "_")
-        nc = nc.strip("_")
-
-        if nc != c:
-            rename[c] = nc
+    # Each name is normalized once; meta vars reuse the column result (looked up by
+    # name, not position: vars need not line up with the columns, e.g. with cols_skip)
+    normalized = {c: _normalize_name(c) for c in df.columns}
+    rename = {c: nc for c, nc in normalized.items() if nc != c}
 
     if rename:
         df = df.rename(rename)
 
     for v in meta.get("vars", []):
-        if isinstance(v.get("name"), str):
-            orig = v["name"]
-            normalized = orig.strip().lower().replace(".", "_").replace(" ", "_").replace("-", "_")
-            while "__" in normalized:
-                normalized = normalized.replace("__", "_")
-            v["name"] = normalized.strip("_")
+        name = v.get("name")
+        if isinstance(name, str):
+            nc = normalized.get(name)
+            v["name"] = _normalize_name(name) if nc is None else nc
 
     return df, meta
 
@@ -231,6 +246,8 @@ def _normalize_cols_skip(cols_skip: list[str] | None) -> list[str] | None:
     """Allow callers to pass names with . or _ interchangeably."""
     if not cols_skip:
         return None
+    if not any("_" in col or "." in col for col in cols_skip):
+        return list(cols_skip)  # nothing to translate
     skip_set: set[str] = set()
     for col in cols_skip:
         skip_set.add(col)
@@ -256,19 +273,14 @@ def read_sav(
     n_max = _normalize_n_max(n_max)
 
     if n_max == 0:
-        return pl.DataFrame({}), {
-            "file_label": None,
-            "vars": [],
-            "value_labels": [],
-            "user_missing": [],
-            "n_rows": 0,
-        }
+        return pl.DataFrame({}), _empty_meta()
 
     normalized_cols_skip = _normalize_cols_skip(cols_skip)
 
     # Native parse (GIL released)
     with _as_path(data_path) as _path:
-        ipc_bytes, meta_json = native.df_parse_sav_file(
+        df, meta_json = _parse_via_ipc_file(
+            native.df_parse_sav_file,
             _path,
             encoding or None,
             user_na,
@@ -277,29 +289,15 @@ def read_sav(
             rows_skip,
         )
 
-    meta: Dict[str, Any] = json.loads(meta_json)
-
-    bio = io.BytesIO(ipc_bytes)
-    try:
-        df = pl.read_ipc(bio, memory_map=False)
-    except ComputeError as e:
-        if "InvalidFooter" in str(e):
-            bio.seek(0)
-            df = pl.read_ipc_stream(bio)
-        else:
-            raise
+    meta: Dict[str, Any] = _json_loads(meta_json)
 
     # Normalize names BEFORE downstream processing
     df, meta = _normalize_names(df, meta)
 
     if coerce_temporals:
-        from svy_io.temporals import coerce_spss_temporals
-
         df = coerce_spss_temporals(df, meta)
 
     if zap_empty_str:
-        from svy_io.zap import zap_empty
-
         df = zap_empty(df)
 
     df, meta = _hydrate_user_missing(df, meta, user_na)
@@ -321,18 +319,13 @@ def read_por(
     n_max = _normalize_n_max(n_max)
 
     if n_max == 0:
-        return pl.DataFrame({}), {
-            "file_label": None,
-            "vars": [],
-            "value_labels": [],
-            "user_missing": [],
-            "n_rows": 0,
-        }
+        return pl.DataFrame({}), _empty_meta()
 
     normalized_cols_skip = _normalize_cols_skip(cols_skip)
 
     with _as_path(data_path) as _path:
-        ipc_bytes, meta_json = native.df_parse_por_file(
+        df, meta_json = _parse_via_ipc_file(
+            native.df_parse_por_file,
             _path,
             None,
             user_na,
@@ -341,28 +334,14 @@ def read_por(
             rows_skip,
         )
 
-    meta: Dict[str, Any] = json.loads(meta_json)
-
-    bio = io.BytesIO(ipc_bytes)
-    try:
-        df = pl.read_ipc(bio, memory_map=False)
-    except ComputeError as e:
-        if "InvalidFooter" in str(e):
-            bio.seek(0)
-            df = pl.read_ipc_stream(bio)
-        else:
-            raise
+    meta: Dict[str, Any] = _json_loads(meta_json)
 
     df, meta = _normalize_names(df, meta)
 
     if coerce_temporals:
-        from svy_io.temporals import coerce_spss_temporals
-
         df = coerce_spss_temporals(df, meta)
 
     if zap_empty_str:
-        from svy_io.zap import zap_empty
-
         df = zap_empty(df)
 
     df, meta = _hydrate_user_missing(df, meta, user_na)
@@ -414,30 +393,41 @@ def read_spss(
 
 # ---------------- SPSS WRITERS ----------------
 
-_SPSS_RESERVED = {
-    "ALL",
-    "AND",
-    "BY",
-    "EQ",
-    "GE",
-    "GT",
-    "LE",
-    "LT",
-    "NE",
-    "NOT",
-    "OR",
-    "TO",
-    "WITH",
-}
+_SPSS_RESERVED = frozenset(
+    {
+        "ALL",
+        "AND",
+        "BY",
+        "EQ",
+        "GE",
+        "GT",
+        "LE",
+        "LT",
+        "NE",
+        "NOT",
+        "OR",
+        "TO",
+        "WITH",
+    }
+)
+# Longest reserved word; longer names can't match (str.upper() never shortens)
+_RESERVED_MAXLEN = max(map(len, _SPSS_RESERVED))
+
+
+# Letters, digits and "_" (Unicode-aware, same set as str.isalnum() plus "_")
+_VARNAME_TAIL_RE = re.compile(r"\w*")
 
 
 def _is_valid_varname(name: str) -> bool:
     """Early exits, simpler checks"""
-    if not name or len(name.encode("utf-8")) > 64:
+    if not name:
+        return False
+    # The limit is 64 bytes of UTF-8; only non-ASCII names need encoding to measure it
+    if (len(name) if name.isascii() else len(name.encode("utf-8"))) > 64:
         return False
     if not name[0].isalpha():
         return False
-    return all(ch.isalnum() or ch == "_" for ch in name[1:])
+    return _VARNAME_TAIL_RE.fullmatch(name, 1) is not None
 
 
 def _validate_sav(df: pl.DataFrame) -> None:
@@ -455,7 +445,7 @@ def _validate_sav(df: pl.DataFrame) -> None:
         if not _is_valid_varname(name):
             raise ValueError(f"Invalid variable name: {name!r}")
 
-        if name.upper() in _SPSS_RESERVED:
+        if len(name) <= _RESERVED_MAXLEN and name.upper() in _SPSS_RESERVED:
             raise ValueError(f"Invalid/reserved variable name: {name!r}")
 
 
@@ -479,49 +469,42 @@ def write_sav(
 
     to_write = df
     if adjust_tz:
-        from .stata import _adjust_temporals
-
         to_write = _adjust_temporals(df, adjust_tz=True)
 
-    # Batch process categorical columns
-    categorical_labels: Dict[str, Dict[str, str]] = {}
-    categorical_exprs: List[pl.Expr] = []
-
-    for col_name in to_write.columns:
-        if to_write[col_name].dtype == pl.Categorical:
-            cats = to_write[col_name].cat.get_categories()
-
-            # Convert to 1-based codes
-            codes = (to_write[col_name].to_physical() + 1).cast(pl.Float64)
-            categorical_exprs.append(codes.alias(col_name))
-
-            # Create value labels
-            labels = {str(i + 1): cats[i] for i in range(len(cats))}
-            categorical_labels[col_name] = labels
+    # Batch process categorical columns: 1-based codes in one with_columns, labels from
+    # each column's categories
+    cat_cols = [c for c, dtype in to_write.schema.items() if dtype == pl.Categorical]
+    categorical_labels: Dict[str, Dict[str, str]] = {
+        c: {
+            str(i): cat
+            for i, cat in enumerate(to_write.get_column(c).cat.get_categories().to_list(), 1)
+        }
+        for c in cat_cols
+    }
 
-    if categorical_exprs:
-        to_write = to_write.with_columns(categorical_exprs)
+    if cat_cols:
+        to_write = to_write.with_columns(
+            (pl.col(c).to_physical().cast(pl.Float64) + 1.0).alias(c) for c in cat_cols
+        )
 
     # Merge categorical labels with user-provided
     if categorical_labels:
         if value_labels is None:
             value_labels = []
 
+        # Index the user's entries once; reversed so the first entry per column wins
+        vl_by_col = {vl["col"]: vl for vl in reversed(value_labels)}
         for col_name, labels in categorical_labels.items():
-            existing = next((vl for vl in value_labels if vl["col"] == col_name), None)
+            existing = vl_by_col.get(col_name)
             if existing:
                 existing["labels"].update(labels)
             else:
                 value_labels.append({"col": col_name, "labels": labels})
 
-    # Convert to Arrow IPC
-    bio = io.BytesIO()
-    to_write.write_ipc(bio)
-    ipc_bytes = bio.getvalue()
-
-    # Call native writer
+    # Call native writer, handing it the frame over the Arrow C stream interface (no
+    # IPC encode + bytes copy)
     native.df_write_sav_file(
-        ipc_bytes,
+        to_write,
         path,
         compress=compress,
         var_labels=var_labels,
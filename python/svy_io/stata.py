@@ -2,79 +2,36 @@
 from __future__ import annotations
 
 import io
-import json
-import math
 import os
-import re
 import tempfile
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 import polars as pl
 import svy_io.svyreadstat_rs as native
 
-from polars.exceptions import ComputeError
-
-from .helpers import _as_path, _normalize_n_max
+from .helpers import (
+    MetaIndex,
+    _as_path,
+    _empty_meta,
+    _hydrate_tagged_na,
+    _is_ipc_file,
+    _json_dumps,
+    _json_loads,
+    _normalize_n_max,
+    _parse_via_ipc_file,
+    _value_label_sets,
+    _value_labels_for_column,
+)
 from .tagged_na import TaggedNA
-
-
-_STATA_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
-
-
-def _hydrate_tagged_na(df: pl.DataFrame, meta: Dict[str, Any]) -> pl.DataFrame:
-    """
-    Replace markers described in meta["tagged_missings"] with TaggedNA objects.
-    Only builds replacement series if something actually changes.
-    """
-    specs: List[Dict[str, Any]] = meta.get("tagged_missings") or []
-    if not specs:
-        return df
-
-    # Group specs by column for batch processing
-    col_specs: dict[str, list] = {}
-    for spec in specs:
-        col = spec.get("col") or spec.get("name")
-        if col and col in df.columns:
-            col_specs.setdefault(col, []).append(spec)
-
-    if not col_specs:
-        return df
-
-    replacements: list[pl.Series] = []
-    for col, specs_for_col in col_specs.items():
-        vals = df[col].to_list()
-        changed = False
-
-        for spec in specs_for_col:
-            # A) explicit rows+tags
-            rows, tags = spec.get("rows"), spec.get("tags")
-            if rows and tags and len(rows) == len(tags):
-                for r, t in zip(rows, tags):
-                    if 0 <= r < len(vals):
-                        vals[r] = TaggedNA(t)
-                        changed = True
-                continue
-
-            # B) value-based mapping
-            by_value = spec.get("by_value")
-            if isinstance(by_value, dict) and by_value:
-                for i, v in enumerate(vals):
-                    t = by_value.get(v)
-                    if t is not None:
-                        vals[i] = TaggedNA(t)
-                        changed = True
-
-        if changed:
-            replacements.append(pl.Series(name=col, values=vals, dtype=pl.Object))
-
-    return df.with_columns(replacements) if replacements else df
+from .temporals import coerce_stata_temporals
+from .zap import zap_empty
 
 
 def _build_value_label_lookup(meta: dict) -> dict[str, dict[str, str]]:
     """Direct dict comprehension"""
-    return {vl["set_name"]: vl["mapping"] for vl in meta.get("value_labels", [])}
+    return _value_label_sets(meta)
 
 
 def _column_label_map(meta: dict) -> dict[str, dict[str, Any]]:
@@ -94,21 +51,11 @@ def get_column_labels(meta: dict) -> dict[str, str | None]:
     return {v["name"]: v.get("label") for v in meta.get("vars", [])}
 
 
-def get_value_labels_for_column(meta: dict, col_name: str) -> dict[str, str] | None:
-    # Find column metadata in single pass
-    col_info = next((v for v in meta.get("vars", []) if v["name"] == col_name), None)
-    if not col_info:
-        return None
-
-    set_name = col_info.get("label_set")
-    if not set_name:
-        return None
-
-    # Find label set in single pass
-    labels = next(
-        (vl["mapping"] for vl in meta.get("value_labels", []) if vl["set_name"] == set_name), None
-    )
-    return labels
+def get_value_labels_for_column(
+    meta: dict, col_name: str, *, compiled: MetaIndex | None = None
+) -> dict[str, str] | None:
+    # Pass compiled=_compile_meta(meta) when looping over columns: O(1) per lookup
+    return _value_labels_for_column(meta, col_name, compiled)
 
 
 def read_dta(
@@ -122,30 +69,21 @@ def read_dta(
     factorize: bool = False,
     levels: str = "default",
     ordered: bool = False,
+    tagged_na: str = "object",  # "object" | "column" (see svy_io.sas.read_sas)
 ) -> Tuple[pl.DataFrame, Dict[str, Any]]:
-    # Lazy imports only when needed
-    if coerce_temporals:
-        from svy_io.temporals import coerce_stata_temporals  # type: ignore
-    if zap_empty_str:
-        from svy_io.zap import zap_empty  # type: ignore
     if factorize:
-        from svy_io.sas import apply_value_labels  # reuse shared impl
+        # reuse shared impl; imported here because svy_io.sas imports this module
+        from svy_io.sas import apply_value_labels
 
     n_max = _normalize_n_max(n_max)
     if n_max == 0:
-        empty = pl.DataFrame({})
-        meta: Dict[str, Any] = {
-            "file_label": None,
-            "vars": [],
-            "value_labels": [],
-            "user_missing": [],
-            "n_rows": 0,
-        }
-        return empty, meta
+        return pl.DataFrame({}), _empty_meta()
 
-    # Rust does the heavy lifting here (with GIL released).
+    # Rust does the heavy lifting here (with GIL released) and writes the IPC
+    # file itself, so the payload never crosses the FFI boundary as bytes.
     with _as_path(data_path) as _path:
-        ipc_bytes, meta_json = native.df_parse_dta_file(  # type: ignore[attr-defined]
+        df, meta_json = _parse_via_ipc_file(
+            native.df_parse_dta_file,  # type: ignore[attr-defined]
             _path,
             cols_skip,
             n_max,
@@ -153,30 +91,20 @@ def read_dta(
         )
 
     # Parse JSON once
-    meta: Dict[str, Any] = json.loads(meta_json)
-
-    # Read IPC with proper error handling
-    bio = io.BytesIO(ipc_bytes)
-    try:
-        df = pl.read_ipc(bio, memory_map=False)
-    except ComputeError as e:
-        if "InvalidFooter" in str(e):
-            bio.seek(0)
-            df = pl.read_ipc_stream(bio)
-        else:
-            raise
-
-    # Apply transformations
+    meta: Dict[str, Any] = _json_loads(meta_json)
+
+    # Apply transformations as one lazy plan, collected once
+    lf = df.lazy()
     if coerce_temporals:
-        df = coerce_stata_temporals(df, meta)  # type: ignore
+        lf = coerce_stata_temporals(lf, meta)
     if zap_empty_str:
-        df = zap_empty(df)  # type: ignore
+        lf = zap_empty(lf)
     if factorize:
-        df = apply_value_labels(df, meta, levels=levels, ordered=ordered)  # type: ignore
+        lf = apply_value_labels(lf, meta, levels=levels, ordered=ordered)
+    df = lf.collect()
 
-    # Only hydrate if there are tagged missings
-    if meta.get("tagged_missings"):
-        df = _hydrate_tagged_na(df, meta)
+    # No-op unless there are tagged missings
+    df = _hydrate_tagged_na(df, meta, mode=tagged_na)
 
     return df, meta
 
@@ -195,19 +123,10 @@ def read_stata_arrow(
     import pyarrow as pa
     import pyarrow.ipc as pa_ipc
 
-    from pyarrow import ArrowInvalid
-
     n_max = _normalize_n_max(n_max)
     if n_max == 0:
         empty = pa.table({})
-        meta = {
-            "file_label": None,
-            "vars": [],
-            "value_labels": [],
-            "user_missing": [],
-            "n_rows": 0,
-        }
-        return empty, meta
+        return empty, _empty_meta()
 
     with _as_path(data_path) as _path:
         ipc_bytes, meta_json = native.df_parse_dta_file(  # type: ignore[attr-defined]
@@ -217,14 +136,12 @@ def read_stata_arrow(
             rows_skip,
         )
 
-    bio = io.BytesIO(ipc_bytes)
-    try:
-        table = pa_ipc.open_file(bio).read_all()
-    except ArrowInvalid:
-        bio.seek(0)
-        table = pa_ipc.open_stream(bio).read_all()
+    # Zero-copy C++ reader over the bytes; BytesIO would go through Python-level reads
+    src = pa.BufferReader(pa.py_buffer(ipc_bytes))
+    reader = pa_ipc.open_file(src) if _is_ipc_file(ipc_bytes) else pa_ipc.open_stream(src)
+    table = reader.read_all()
 
-    meta = json.loads(meta_json)
+    meta = _json_loads(meta_json)
     return table, meta
 
 
@@ -270,7 +187,8 @@ def _validate_dta_names_and_labels(
 
     # Check name format for old Stata versions
     if version_human < 14:
-        bad = [c for c in df.columns if not _STATA_NAME_RE.match(c)]
+        # An ASCII identifier is exactly [A-Za-z_][A-Za-z0-9_]*, checked in C
+        bad = [c for c in df.columns if not (c.isascii() and c.isidentifier())]
         if bad:
             raise ValueError(
                 "Variables for Stata <14 must match ^[A-Za-z_][A-Za-z0-9_]*$: " + ", ".join(bad)
@@ -284,13 +202,11 @@ def _validate_dta_names_and_labels(
     if value_labels:
         offenders: dict[str, list] = {}
         for var, mp in value_labels.items():
+            # bool is an int; float.is_integer() is False for NaN/±inf
             bad_keys = [
                 k
-                for k in mp.keys()
-                if not (
-                    isinstance(k, (int, bool))
-                    or (isinstance(k, float) and math.isfinite(k) and int(k) == k)
-                )
+                for k in mp
+                if not (isinstance(k, int) or (isinstance(k, float) and k.is_integer()))
             ]
             if bad_keys:
                 offenders[var] = bad_keys
@@ -309,29 +225,35 @@ def _ensure_strl_policy(df: pl.DataFrame, *, version_human: int, strl_threshold:
     if version_human >= 13:
         return  # strL supported, no check needed
 
-    # Only check string columns for old versions
-    for c, t in df.schema.items():
-        if t == pl.Utf8:
-            max_len = df.select(pl.col(c).str.len_bytes().fill_null(0).max()).item() or 0
-            if int(max_len) > 244:
-                raise ValueError(
-                    f"Column '{c}' contains strings of length {max_len}, but Stata < 13 has no strL support."
-                )
+    # Only check string columns for old versions; all maxima come from one select
+    utf8 = [c for c, t in df.schema.items() if t == pl.Utf8]
+    if not utf8:
+        return
+    maxes = df.select(pl.col(c).str.len_bytes().max() for c in utf8).row(0)
+    for c, max_len in zip(utf8, maxes):
+        if (max_len or 0) > 244:
+            raise ValueError(
+                f"Column '{c}' contains strings of length {max_len}, but Stata < 13 has no strL support."
+            )
 
 
-def _apply_inf_policy(df: pl.DataFrame, *, na_policy: str) -> pl.DataFrame:
+def _apply_inf_policy(
+    df: pl.DataFrame | pl.LazyFrame, *, na_policy: str
+) -> pl.DataFrame | pl.LazyFrame:
     """
     Vectorized ±Inf handling on float columns.
     - 'keep': no-op
     - 'error': raise if any ±Inf present
     - 'nan': replace ±Inf with nulls (preserve NaN as NaN)
+    A LazyFrame gets the replacement added to its plan ('error' still has to scan).
     """
     if na_policy not in {"nan", "error", "keep"}:
         raise ValueError("na_policy must be one of {'nan','error','keep'}")
     if na_policy == "keep":
         return df
 
-    float_cols = [name for name, dt in df.schema.items() if dt in (pl.Float32, pl.Float64)]
+    schema = df.collect_schema()
+    float_cols = [name for name, dt in schema.items() if dt in (pl.Float32, pl.Float64)]
     if not float_cols:
         return df
 
@@ -340,7 +262,7 @@ def _apply_inf_policy(df: pl.DataFrame, *, na_policy: str) -> pl.DataFrame:
         inf_any_exprs = [
             ((~pl.col(c).is_finite()) & (~pl.col(c).is_nan())).any().alias(c) for c in float_cols
         ]
-        flags = df.select(inf_any_exprs).row(0)
+        flags = df.lazy().select(inf_any_exprs).collect().row(0)
         bad = [c for c, has_inf in zip(float_cols, flags) if has_inf]
         if bad:
             raise ValueError(f"Found ±Inf values but na_policy='error' in columns: {bad}")
@@ -349,7 +271,7 @@ def _apply_inf_policy(df: pl.DataFrame, *, na_policy: str) -> pl.DataFrame:
     # na_policy == "nan": replace only infinities with nulls, keep NaN as NaN
     exprs = []
     for c in float_cols:
-        dt = df.schema[c]
+        dt = schema[c]
         col = pl.col(c)
         exprs.append(
             pl.when(col.is_finite() | col.is_null() | col.is_nan())
@@ -361,31 +283,22 @@ def _apply_inf_policy(df: pl.DataFrame, *, na_policy: str) -> pl.DataFrame:
     return df.with_columns(exprs)
 
 
-def _adjust_temporals(df: pl.DataFrame, *, adjust_tz: bool) -> pl.DataFrame:
-    """Batch process datetime columns"""
-    datetime_cols = [
-        (name, dt)
-        for name, dt in df.schema.items()
-        if isinstance(dt, pl.datatypes.Datetime) and getattr(dt, "time_zone", None)
-    ]
-    if not datetime_cols:
-        return df
-
-    new_series = []
-    for name, _dt in datetime_cols:
-        s = df[name]
-        try:
-            s2 = (
-                s.dt.replace_time_zone(None)
-                if adjust_tz
-                else s.dt.convert_time_zone("UTC").dt.replace_time_zone(None)
-            )
-            new_series.append(s2.alias(name))
-        except Exception:
-            # If any conversion fails, skip that column silently
-            pass
-
-    return df.with_columns(new_series) if new_series else df
+def _adjust_temporals(
+    df: pl.DataFrame | pl.LazyFrame, *, adjust_tz: bool
+) -> pl.DataFrame | pl.LazyFrame:
+    """
+    Make tz-aware datetime columns naive in one with_columns: keep the local wall
+    time (adjust_tz=True) or convert to UTC first. Works on a LazyFrame too.
+    """
+    exprs = []
+    for name, dt in df.collect_schema().items():
+        # Polars validates time zones when the dtype is built, so these cannot fail
+        if isinstance(dt, pl.Datetime) and dt.time_zone:
+            col = pl.col(name)
+            if not adjust_tz:
+                col = col.dt.convert_time_zone("UTC")
+            exprs.append(col.dt.replace_time_zone(None).alias(name))
+    return df.with_columns(exprs) if exprs else df
 
 
 def _extract_tagged_missings(
@@ -395,63 +308,33 @@ def _extract_tagged_missings(
     specs: list[dict[str, object]] = []
     new_series = []
 
-    for name in df.columns:
+    # TaggedNA is a Python object, so only Object columns can hold one
+    for name, dtype in df.schema.items():
+        if dtype != pl.Object:
+            continue
         vals = df[name].to_list()
-        rows: list[int] = []
-        tags: list[str] = []
-        changed = False
-
-        for i, v in enumerate(vals):
-            if isinstance(v, TaggedNA):
-                rows.append(i)
-                tags.append(v.tag)
-                vals[i] = None
-                changed = True
-
-        if changed:
-            # Stata tagged-missings only apply to numeric; we store as f64
-            new_series.append(pl.Series(name=name, values=vals, dtype=pl.Float64))
-            specs.append({"col": name, "rows": rows, "tags": tags})
+        rows = [i for i, v in enumerate(vals) if isinstance(v, TaggedNA)]
+        if not rows:
+            continue
+
+        tags = [vals[i].tag for i in rows]
+        for i in rows:
+            vals[i] = None
+        # Stata tagged-missings only apply to numeric; we store as f64
+        new_series.append(pl.Series(name=name, values=vals, dtype=pl.Float64))
+        specs.append({"col": name, "rows": rows, "tags": tags})
 
     out = df.with_columns(new_series) if new_series else df
     return out, specs
 
 
-def _coerce_ints_to_f64_for_stata(df: pl.DataFrame) -> pl.DataFrame:
-    """Cast all integer columns to Float64 (Stata writer expects numeric doubles)."""
-    int_dtypes = {
-        pl.Int8,
-        pl.Int16,
-        pl.Int32,
-        pl.Int64,
-        pl.UInt8,
-        pl.UInt16,
-        pl.UInt32,
-        pl.UInt64,
-    }
-    casts = [
-        pl.col(name).cast(pl.Float64) for name, dtype in df.schema.items() if dtype in int_dtypes
-    ]
-    return df.with_columns(casts) if casts else df
-
-
-def _df_to_ipc_bytes(df: pl.DataFrame) -> bytes:
-    """Fast IPC serialization"""
-    bio = io.BytesIO()
-    df.write_ipc(bio)
-    return bio.getvalue()
-
-
 def _columns_with_interior_nul(df: pl.DataFrame) -> list[str]:
-    """Early exit on first match per column"""
-    hits: list[str] = []
-    for name, dt in df.schema.items():
-        if dt == pl.Utf8:
-            for v in df[name].to_list():
-                if isinstance(v, str) and "\x00" in v:
-                    hits.append(name)
-                    break
-    return hits
+    """One native select over all string columns; no Python strings are built"""
+    utf8 = [name for name, dt in df.schema.items() if dt == pl.Utf8]
+    if not utf8:
+        return []
+    flags = df.select(pl.col(c).str.contains("\x00", literal=True).any() for c in utf8).row(0)
+    return [c for c, hit in zip(utf8, flags) if hit]
 
 
 def write_dta(
@@ -502,16 +385,17 @@ def write_dta(
             "the NULs before writing."
         )
 
-    # Pipeline transformations
-    df_w = _apply_inf_policy(df, na_policy=na_policy)
-    df_w = _adjust_temporals(df_w, adjust_tz=adjust_tz)
-    df_w, user_missing_specs = _extract_tagged_missings(df_w)
-    df_w = _coerce_ints_to_f64_for_stata(df_w)
+    # Pipeline transformations: expression-only steps go into one lazy plan; tagged
+    # missings need the Python objects, so they are extracted after the collect
+    lf = _apply_inf_policy(df.lazy(), na_policy=na_policy)
+    lf = _adjust_temporals(lf, adjust_tz=adjust_tz)
+    df_w, user_missing_specs = _extract_tagged_missings(lf.collect())
+    # Integer columns go over as-is: the native writer widens every integer (and
+    # boolean) width to double row by row, so a Float64 copy here would be wasted.
 
-    ipc_bytes = _df_to_ipc_bytes(df_w)
-    var_labels_json = json.dumps(var_labels) if var_labels else None
-    value_labels_json = json.dumps(value_labels) if value_labels else None
-    user_missing_json = json.dumps(user_missing_specs) if user_missing_specs else None
+    var_labels_json = _json_dumps(var_labels) if var_labels else None
+    value_labels_json = _json_dumps(value_labels) if value_labels else None
+    user_missing_json = _json_dumps(user_missing_specs) if user_missing_specs else None
 
     if not hasattr(native, "df_write_dta_file"):
         raise NotImplementedError(
@@ -519,8 +403,9 @@ def write_dta(
             "Implement it in Rust (see native/svyreadstat_rs/src/stata.rs)."
         )
 
+    # Hand the frame over the Arrow C stream interface (no IPC encode + bytes copy)
     native.df_write_dta_file(  # type: ignore[attr-defined]
-        ipc_bytes,
+        df_w,
         out_path,
         int(version_internal),
         file_label,
@@ -1,6 +1,7 @@
 # python/svy_io/tagged_na.py
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, List, Optional, Sequence, Union
 
 Scalar = Union[int, float, str, None]
@@ -27,15 +28,19 @@ class TaggedNA:
         return hash(self.tag)
 
 
+# Instances are immutable, so one per tag can be shared; files use a handful of tags
+_intern_tagged_na = lru_cache(maxsize=256)(TaggedNA)
+
+
 def tagged_na(tag: Union[str, Sequence[str]]) -> Union[TaggedNA, List[TaggedNA]]:
     """
     Create tagged NA(s).
 
-    OPTIMIZED: Early type check, list comprehension.
+    OPTIMIZED: Early type check, list comprehension, interned instances.
     """
     if isinstance(tag, str):
-        return TaggedNA(tag)
-    return [TaggedNA(t) for t in tag]
+        return _intern_tagged_na(tag)
+    return [_intern_tagged_na(t) for t in tag]
 
 
 def is_tagged_na(
@@ -43,13 +43,11 @@ def coerce_sas_temporals(df: pl.DataFrame, meta: dict) -> pl.DataFrame:
     """
     conversions = []
 
+    schema = df.schema  # snapshot: per-var dict lookup instead of a df.columns scan
     for v in meta.get("vars", []):
         name = v.get("name")
-        if name not in df.columns:
-            continue
-
-        s = df[name]
-        if not _is_numeric(s.dtype):
+        dtype = schema.get(name)
+        if dtype is None or not _is_numeric(dtype):
             continue
 
         fmt = (v.get("fmt") or v.get("format") or "").lower()
@@ -74,19 +72,20 @@ def coerce_sas_temporals(df: pl.DataFrame, meta: dict) -> pl.DataFrame:
 # ---------------- Stata ----------------
 
 
-def coerce_stata_temporals(df: pl.DataFrame, meta: dict) -> pl.DataFrame:
+def coerce_stata_temporals(
+    df: pl.DataFrame | pl.LazyFrame, meta: dict
+) -> pl.DataFrame | pl.LazyFrame:
     """
     OPTIMIZED: Batch process all temporal conversions.
+    Accepts a LazyFrame too, in which case the casts are only added to its plan.
     """
     conversions = []
 
+    schema = df.collect_schema()  # snapshot: per-var dict lookup, not a df.columns scan
     for v in meta.get("vars", []):
         name = v.get("name")
-        if name not in df.columns:
-            continue
-
-        s = df[name]
-        if not _is_numeric(s.dtype):
+        dtype = schema.get(name)
+        if dtype is None or not _is_numeric(dtype):
             continue
 
         fmt = (v.get("fmt") or v.get("format") or "").lower()
@@ -125,46 +124,26 @@ def _infer_spss_fmt_from_name(name: str) -> str | None:
     return None
 
 
-def _looks_like_spss_seconds(x: pl.Series) -> bool:
-    """
-    OPTIMIZED: Single try-except, simpler logic.
-    SPSS datetime seconds range: ~5e8 to 5e10 for dates 1600-2300
-    """
-    try:
-        s = x.drop_nulls().cast(pl.Float64)
-        if s.len() == 0:
-            return False
+# Median ranges (exclusive) that identify raw numeric timestamps without a format
+_UNIX_MS_RANGE = (1e11, 1e13)  # Unix milliseconds: dates 1970-2100
+_UNIX_SEC_RANGE = (1e8, 5e9)  # Unix seconds: dates 1970-2100
+_SPSS_SEC_RANGE = (5e8, 5e10)  # SPSS datetime seconds: dates 1600-2300
 
-        m = s.quantile(0.5, interpolation="nearest")
-        return 5e8 < m < 5e10
-    except Exception:
-        return False
+_POSIX_FMTS = ("POSIX", "POSIX_MS", "POSIX_SEC")
 
 
-def _looks_like_unix_milliseconds(x: pl.Series) -> bool:
-    """Unix milliseconds: 1e11 to 1e13 for dates 1970-2100"""
-    try:
-        s = x.drop_nulls().cast(pl.Float64)
-        if s.len() == 0:
-            return False
+def _nearest_medians(df: pl.DataFrame, cols: list[str]) -> dict[str, float | None]:
+    """Median (nearest, nulls ignored) of each column, all computed in one select"""
+    if not cols:
+        return {}
+    row = df.select(
+        pl.col(c).cast(pl.Float64).quantile(0.5, interpolation="nearest") for c in cols
+    ).row(0)
+    return dict(zip(cols, row))
 
-        m = s.quantile(0.5, interpolation="nearest")
-        return 1e11 < m < 1e13
-    except Exception:
-        return False
 
-
-def _looks_like_unix_seconds(x: pl.Series) -> bool:
-    """Unix seconds: 1e8 to 5e9 for dates 1970-2100"""
-    try:
-        s = x.drop_nulls().cast(pl.Float64)
-        if s.len() == 0:
-            return False
-
-        m = s.quantile(0.5, interpolation="nearest")
-        return 1e8 < m < 5e9
-    except Exception:
-        return False
+def _in_range(m: float | None, bounds: tuple[float, float]) -> bool:
+    return m is not None and bounds[0] < m < bounds[1]
 
 
 def _coerce_string_iso_datetime(series: pl.Series) -> pl.Series | None:
@@ -205,31 +184,36 @@ def coerce_spss_temporals(df: pl.DataFrame, meta: dict) -> pl.DataFrame:
     """
     # Build metadata lookup once (O(1) access)
     var_meta = {v.get("name"): v for v in meta.get("vars", []) if v.get("name")}
+    schema = df.schema
 
-    # Collect all conversions
-    conversions = []
-
+    # Format per column: metadata first, else inferred from the name
+    fmts: dict[str, str] = {}
     for col_name in df.columns:
-        s = df[col_name]
         v = var_meta.get(col_name)
+        fmt = (v.get("fmt") or v.get("format") or "") if v else ""
+        fmts[col_name] = fmt.upper() or _infer_spss_fmt_from_name(col_name) or ""
 
-        # Get format
-        fmt = v.get("fmt") or v.get("format") if v else ""
-        fmt_u = fmt.upper()
+    # Raw numeric timestamps are recognised by their median: compute every median
+    # needed (no format, or POSIX) in one select, once per column
+    medians = _nearest_medians(
+        df,
+        [c for c, f in fmts.items() if _is_numeric(schema[c]) and (not f or f in _POSIX_FMTS)],
+    )
 
-        # Infer from name if no format
-        if not fmt_u:
-            name_hint = _infer_spss_fmt_from_name(col_name)
-            if name_hint:
-                fmt_u = name_hint
+    # Collect all conversions
+    conversions = []
+
+    for col_name, fmt_u in fmts.items():
+        dtype = schema[col_name]
 
         # Additional heuristics for numeric columns
-        if not fmt_u and _is_numeric(s.dtype):
-            if _looks_like_unix_milliseconds(s):
+        if not fmt_u and _is_numeric(dtype):
+            m = medians[col_name]
+            if _in_range(m, _UNIX_MS_RANGE):
                 fmt_u = "POSIX_MS"
-            elif _looks_like_unix_seconds(s):
+            elif _in_range(m, _UNIX_SEC_RANGE):
                 fmt_u = "POSIX_SEC"
-            elif _looks_like_spss_seconds(s):
+            elif _in_range(m, _SPSS_SEC_RANGE):
                 fmt_u = "DATETIME"
 
         # Skip if no format
@@ -239,13 +223,11 @@ def coerce_spss_temporals(df: pl.DataFrame, meta: dict) -> pl.DataFrame:
         col_ref = pl.col(col_name)
 
         # ---- Numeric coercions ----
-        if _is_numeric(s.dtype):
+        if _is_numeric(dtype):
             # POSIX/Unix timestamps (check first)
-            if fmt_u in ("POSIX", "POSIX_MS", "POSIX_SEC"):
-                if _looks_like_unix_milliseconds(s):
-                    conversions.append(pl.from_epoch(col_ref, time_unit="ms").alias(col_name))
-                else:
-                    conversions.append(pl.from_epoch(col_ref, time_unit="s").alias(col_name))
+            if fmt_u in _POSIX_FMTS:
+                unit = "ms" if _in_range(medians[col_name], _UNIX_MS_RANGE) else "s"
+                conversions.append(pl.from_epoch(col_ref, time_unit=unit).alias(col_name))
                 continue
 
             # DATETIME (must check before DATE)
@@ -273,7 +255,8 @@ def coerce_spss_temporals(df: pl.DataFrame, meta: dict) -> pl.DataFrame:
                 continue
 
         # ---- String fallbacks ----
-        if s.dtype in (pl.Utf8, pl.String):
+        if dtype in (pl.Utf8, pl.String):
+            s = df[col_name]
             parsed = None
 
             if fmt_u.startswith(("DATETIME", "TIMESTAMP", "E8601DT")) or fmt_u in (
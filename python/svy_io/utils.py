@@ -65,13 +65,18 @@ def adjust_tz(df: pl.DataFrame) -> pl.DataFrame:
     """
     Apply force_utc to all Datetime columns.
 
-    OPTIMIZED: Single with_columns call, early exit.
+    OPTIMIZED: Single with_columns call, early exit. The zone of each column is
+    known from the schema, so no Series is pulled out of the frame.
     """
-    # Collect all datetime column expressions
+    # Collect all datetime column expressions (UTC columns are already done)
     exprs = [
-        force_utc(df[name]).alias(name)
+        (
+            pl.col(name).dt.replace_time_zone("UTC")
+            if dt.time_zone is None
+            else pl.col(name).dt.convert_time_zone("UTC")
+        )
         for name, dt in df.schema.items()
-        if isinstance(dt, pl.Datetime)
+        if isinstance(dt, pl.Datetime) and dt.time_zone != "UTC"
     ]
 
     # Single batch update or return unchanged
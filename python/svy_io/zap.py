@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import copy
+import pickle
 
 from typing import Any, Dict, List, Tuple, cast, overload
 
@@ -10,25 +11,29 @@ import polars as pl
 from svy_io.tagged_na import TaggedNA
 
 
-INT_DTYPES = (
-    pl.Int8,
-    pl.Int16,
-    pl.Int32,
-    pl.Int64,
-    pl.UInt8,
-    pl.UInt16,
-    pl.UInt32,
-    pl.UInt64,
+INT_DTYPES = frozenset(
+    {pl.Int8, pl.Int16, pl.Int32, pl.Int64, pl.UInt8, pl.UInt16, pl.UInt32, pl.UInt64}
 )
 
-FLOAT_DTYPES = (
-    pl.Float32,
-    pl.Float64,
-)
+FLOAT_DTYPES = frozenset({pl.Float32, pl.Float64})
+
+NUMERIC_DTYPES = INT_DTYPES | FLOAT_DTYPES
 
 # ───────────────────────── internal helpers ─────────────────────────
 
 
+def _fast_clone(obj: Any) -> Any:
+    """
+    Deep copy of a metadata tree. A pickle round trip is noticeably cheaper than
+    copy.deepcopy on large dict/list trees and keeps key and tuple types intact;
+    anything that refuses to pickle falls back to deepcopy.
+    """
+    try:
+        return pickle.loads(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return copy.deepcopy(obj)
+
+
 def _require_meta(meta: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(meta, dict):
         raise TypeError("expected a metadata dict")
@@ -36,7 +41,7 @@ def _require_meta(meta: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def _zap_label_meta(meta: Dict[str, Any]) -> Dict[str, Any]:
-    out = copy.deepcopy(_require_meta(meta))
+    out = _fast_clone(_require_meta(meta))
     for v in out.get("vars", []):
         v["label"] = None
     # dataset/file label lives at top-level
@@ -45,7 +50,7 @@ def _zap_label_meta(meta: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def _zap_labels_meta(meta: Dict[str, Any]) -> Dict[str, Any]:
-    out = copy.deepcopy(_require_meta(meta))
+    out = _fast_clone(_require_meta(meta))
     # remove per-column link to label sets
     for v in out.get("vars", []):
         v["label_set"] = None
@@ -55,7 +60,7 @@ def _zap_labels_meta(meta: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def _zap_formats_meta(meta: Dict[str, Any]) -> Dict[str, Any]:
-    out = copy.deepcopy(_require_meta(meta))
+    out = _fast_clone(_require_meta(meta))
     for v in out.get("vars", []):
         # R haven uses format.sas; we store fmt (from your reader)
         v.pop("fmt", None)
@@ -66,7 +71,7 @@ def _zap_formats_meta(meta: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def _zap_widths_meta(meta: Dict[str, Any]) -> Dict[str, Any]:
-    out = copy.deepcopy(_require_meta(meta))
+    out = _fast_clone(_require_meta(meta))
     for v in out.get("vars", []):
         v.pop("display_width", None)
         v.pop("width", None)
@@ -106,14 +111,6 @@ def zap_labels(
 ) -> Tuple[pl.DataFrame, Dict[str, Any]]: ...
 
 
-def _zap_labels_meta(meta: Dict[str, Any]) -> Dict[str, Any]:
-    out = copy.deepcopy(meta)
-    for v in out.get("vars", []):
-        v["label_set"] = None
-    out["value_labels"] = []
-    return out
-
-
 def zap_labels(obj, meta: Dict[str, Any] | None = None, *, user_na: bool = False):
     """
     Remove value labels.
@@ -137,12 +134,14 @@ def zap_labels(obj, meta: Dict[str, Any] | None = None, *, user_na: bool = False
     df: pl.DataFrame = obj
     meta_in: Dict[str, Any] = meta
 
-    # Build quick lookup from incoming meta vars (may not match df exactly)
-    in_map = {v.get("name"): v for v in meta_in.get("vars", [])}
+    # Build quick lookup from incoming meta vars (may not match df exactly). The vars
+    # are cloned once up front; per column a shallow copy is enough since only
+    # top-level keys are overwritten below.
+    in_map = {v.get("name"): v for v in _fast_clone(meta_in.get("vars", []))}
 
     aligned_vars = []
     for name in df.columns:
-        v = copy.deepcopy(in_map.get(name, {}))
+        v = dict(in_map.get(name, {}))
         # ensure required keys
         v["name"] = name
         v["label"] = v.get("label")
@@ -201,7 +200,7 @@ def zap_widths(obj, meta: Dict[str, Any] | None = None):
     if meta is None:
         if not isinstance(obj, dict):
             raise TypeError("zap_widths(meta): meta must be a dict")
-        out = copy.deepcopy(obj)
+        out = _fast_clone(obj)
         for v in out.get("vars", []):
             v.pop("display_width", None)
         return out
@@ -210,7 +209,7 @@ def zap_widths(obj, meta: Dict[str, Any] | None = None):
         raise TypeError("zap_widths(df, meta): df must be a polars.DataFrame")
 
     df = obj
-    meta_out = copy.deepcopy(meta)
+    meta_out = _fast_clone(meta)
     for v in meta_out.get("vars", []):
         v.pop("display_width", None)
     return df, meta_out
@@ -224,29 +223,23 @@ def zap_empty(x: Any):
     Replace empty strings "" with null/None.
 
     - pl.DataFrame: apply to all Utf8 columns (in place via with_columns)
+    - pl.LazyFrame: same, added to the plan without collecting
     - pl.Series:    cast to Utf8 (lossless) and replace "" -> null
     - list/tuple/np.ndarray: return a Python list with "" -> None
     """
-    # ── Polars DataFrame ────────────────────────────────────────────────────────
-    if isinstance(x, pl.DataFrame):
-        # build expressions only for Utf8 columns
-        mods = []
-        for name, dtype in x.schema.items():
-            if dtype == pl.Utf8:
-                mods.append(
-                    pl.when(pl.col(name) == "")
-                    .then(None)
-                    .otherwise(pl.col(name))
-                    .alias(name)
-                )
-        return x.with_columns(mods) if mods else x
+    # ── Polars DataFrame / LazyFrame ───────────────────────────────────────────
+    if isinstance(x, (pl.DataFrame, pl.LazyFrame)):
+        # one selector expression over all Utf8 columns; frames without any are untouched
+        if not any(dtype == pl.Utf8 for dtype in x.collect_schema().values()):
+            return x
+        return x.with_columns(pl.col(pl.Utf8).replace("", None))
 
     # ── Polars Series ──────────────────────────────────────────────────────────
     if isinstance(x, pl.Series):
         s = x
         if s.dtype != pl.Utf8:
             s = s.cast(pl.Utf8, strict=False)
-        return s.map_elements(lambda v: None if v == "" else v)
+        return s.replace("", None)
 
     # ── Python sequence / numpy array ──────────────────────────────────────────
     if isinstance(x, (list, tuple)):
@@ -272,19 +265,21 @@ def _user_missing_map(meta: dict) -> dict:
     umap = {}
     for spec in meta.get("user_missing", []) or []:
         # add "col" to the acceptable aliases
-        col = (
-            spec.get("col") or spec.get("name") or spec.get("column") or spec.get("var")
-        )
+        col = next((spec[k] for k in ("col", "name", "column", "var") if spec.get(k)), None)
         if col:
             umap[col] = {
-                k: spec.get(k)
-                for k in ("na_values", "na_range")
-                if spec.get(k) is not None
+                k: v for k in ("na_values", "na_range") if (v := spec.get(k)) is not None
             }
     return umap
 
 
-def zap_missing(df: pl.DataFrame, meta: dict) -> pl.DataFrame:
+@overload
+def zap_missing(df: pl.DataFrame, meta: dict) -> pl.DataFrame: ...
+@overload
+def zap_missing(df: pl.LazyFrame, meta: dict) -> pl.LazyFrame: ...
+
+
+def zap_missing(df, meta: dict):
     """
     Convert special/user missings to null (NA).
 
@@ -296,30 +291,46 @@ def zap_missing(df: pl.DataFrame, meta: dict) -> pl.DataFrame:
           - 'na_range' : inclusive range [lo, hi] becomes null
         Works for numeric and string columns; string ranges are lexicographic.
 
-    Returns a new DataFrame (metadata unchanged).
+    Returns a new DataFrame (metadata unchanged). A LazyFrame gets the same masks
+    added to its plan and is returned without collecting.
     """
     umap = _user_missing_map(meta)
     exprs: List[pl.Expr] = []
 
-    for name, dtype in df.schema.items():
+    schema = df.collect_schema()
+
+    # floats without user-missing specs only need NaN/±inf nulled: one selector
+    # expression covers them all
+    plain_floats = [n for n, dt in schema.items() if dt in FLOAT_DTYPES and not umap.get(n)]
+    if plain_floats:
+        finite = pl.col(plain_floats)
+        exprs.append(pl.when(finite.is_finite()).then(finite).name.keep())
+
+    for name, dtype in schema.items():
+        spec = umap.get(name)
+        if dtype in FLOAT_DTYPES and not spec:
+            continue  # handled by the selector above
         col = pl.col(name)
 
-        # 1) always clean TaggedNA -> null (works regardless of dtype)
-        col_clean = col.map_elements(
-            lambda v: None if isinstance(v, TaggedNA) else v,
-            return_dtype=dtype,
-        )
+        # 1) clean TaggedNA -> null; only Object columns can hold them, native dtypes
+        #    skip the per-row Python sweep entirely
+        if dtype == pl.Object:
+            col_clean = col.map_elements(
+                lambda v: None if isinstance(v, TaggedNA) else v,
+                return_dtype=dtype,
+            )
+        else:
+            col_clean = col
 
         # 2) start building condition
         cond = None
 
         # floats: null out non-finite
-        if dtype in (pl.Float32, pl.Float64):
+        if dtype in FLOAT_DTYPES:
             nf = ~col_clean.is_finite()
             cond = nf if cond is None else (cond | nf)
 
         # 3) user-defined missings
-        spec = umap.get(name)
         if spec:
             # --- exact values ---
             nv = spec.get("na_values") or []
@@ -357,11 +368,16 @@ def zap_missing(df: pl.DataFrame, meta: dict) -> pl.DataFrame:
             exprs.append(
                 pl.when(cond).then(pl.lit(None)).otherwise(col_clean).alias(name)
             )
-        else:
+        elif dtype == pl.Object:
             # still apply the TaggedNA sweep even if no cond
             exprs.append(col_clean.alias(name))
 
-    return df.with_columns(exprs) if exprs else df
+    if not exprs:
+        return df
+    if isinstance(df, pl.LazyFrame):
+        return df.with_columns(exprs)
+    # run the masks through the lazy engine so they are planned together
+    return df.lazy().with_columns(exprs).collect()
 
 
 def zap_missing_with_meta(df: pl.DataFrame, meta: dict) -> tuple[pl.DataFrame, dict]:
@@ -372,7 +388,7 @@ def zap_missing_with_meta(df: pl.DataFrame, meta: dict) -> tuple[pl.DataFrame, d
     out = zap_missing(df, meta)
 
     # deep copy to avoid mutating caller's meta
-    meta_out = copy.deepcopy(meta)
+    meta_out = _fast_clone(meta)
 
     # index vars by name
     vmap = {v["name"]: v for v in meta_out.get("vars", [])}
@@ -391,21 +407,15 @@ def zap_missing_with_meta(df: pl.DataFrame, meta: dict) -> tuple[pl.DataFrame, d
             return
         mapping = vl_by_name[set_name]["mapping"]
         # keys are strings in meta; compare as strings for Utf8, numeric stringification otherwise
+        to_remove: list = []
         if na_values:
-            if dtype == pl.Utf8:
-                for v in list(na_values):
-                    mapping.pop(str(v), None)
-            else:
-                for v in list(na_values):
-                    mapping.pop(str(v), None)
+            drop = {str(v) for v in na_values}
+            to_remove = [k for k in mapping if k in drop]
         if na_range:
             lo, hi = na_range
             # remove keys in inclusive range
-            to_remove = []
             if dtype == pl.Utf8:
-                for k in mapping.keys():
-                    if lo <= k <= hi:
-                        to_remove.append(k)
+                to_remove += [k for k in mapping if lo <= k <= hi]
             else:
                 # parse numeric keys safely
                 def _num(x):
@@ -417,13 +427,16 @@ def zap_missing_with_meta(df: pl.DataFrame, meta: dict) -> tuple[pl.DataFrame, d
                 lo_n = _num(lo)
                 hi_n = _num(hi)
                 if lo_n is not None and hi_n is not None:
-                    for k in mapping.keys():
-                        kv = _num(k)
-                        if kv is not None and lo_n <= kv <= hi_n:
-                            to_remove.append(k)
-            for k in to_remove:
-                mapping.pop(k, None)
-
+                    to_remove += [
+                        k
+                        for k, kv in ((k, _num(k)) for k in mapping)
+                        if kv is not None and lo_n <= kv <= hi_n
+                    ]
+        for k in to_remove:
+            mapping.pop(k, None)
+
+    # one schema lookup for the whole loop; each df.schema call rebuilds it
+    schema = df.schema
     for um in meta_out.get("user_missing", []):
         col = um.get("col")
         if not col or col not in vmap:
@@ -431,7 +444,7 @@ def zap_missing_with_meta(df: pl.DataFrame, meta: dict) -> tuple[pl.DataFrame, d
         set_name = vmap[col].get("label_set")
 
         # Normalize schema dtype -> concrete pl.DataType
-        dtype_any = df.schema.get(col)
+        dtype_any = schema.get(col)
 
         # Default
         dtype_norm = pl.Utf8
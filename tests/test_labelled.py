@@ -80,6 +80,15 @@ def test_arithmetic_strips_class():
     assert sum(xi.as_list()) == 1
 
 
+def test_arithmetic_missing_and_length_mismatch():
+    import math
+
+    out = labelled([1, None, 3]) + labelled([1.5, 2.0])
+    assert out[0] == 2.5
+    assert math.isnan(out[1])
+    assert len(out) == 2
+
+
 # ---- “methods” parity ----
 
 
@@ -92,6 +101,14 @@ def test_median_quantile_summary_numeric():
     assert s["median"] == 2.0
 
 
+def test_data_is_copied_from_caller_list():
+    data = [1, 2, 3]
+    x = labelled(data)
+    data.append("oops")
+    assert x.data == [1, 2, 3]
+    assert x.median() == 2.0
+
+
 def test_median_quantile_error_on_character():
     x = labelled(["a", "b", "c"])
     with pytest.raises(TypeError):
@@ -126,3 +143,18 @@ def test_as_factor_labels_roundtrip_with_existing_helper():
     # labels-only -> unlabelled values become nulls
     assert cat.dtype == pl.Categorical
     assert cat.to_list() == ["Good", None, "Bad"]
+
+
+def test_as_factor_default_and_both_levels():
+    import polars as pl
+
+    from svy_io import as_factor
+
+    s = pl.Series("x", [1.0, None, 5.0, 3.0])
+    labels = {1: "Good", "5.0": "Bad"}
+
+    assert as_factor(s, labels=labels).to_list() == ["Good", None, "Bad", "3.0"]
+    both = as_factor(s, labels=labels, levels="both")
+    assert both.dtype == pl.Categorical
+    assert both.name == "x"
+    assert both.to_list() == ["[1.0] Good", None, "[5.0] Bad", "3.0"]
@@ -44,6 +44,23 @@ def test_constructor_checks_na_range():
         labelled_spss(list(range(1, 11)), na_range=(2, 1))
 
 
+def test_from_series_matches_constructor():
+    """from_series takes the kind from the dtype but validates like the constructor"""
+    import polars as pl
+
+    s = pl.Series("x", [1.0, 9.0, None, 3.0])
+    x = LabelledSPSS.from_series(s, {1: "Good"}, na_values=[9], label="X")
+    assert x == labelled_spss([1.0, 9.0, None, 3.0], {1: "Good"}, na_values=[9], label="X")
+    assert x.is_na() == [False, True, True, False]
+
+    with pytest.raises(TypeError, match="type"):
+        LabelledSPSS.from_series(s, na_values=["a"])
+    with pytest.raises(TypeError, match="labels"):
+        LabelledSPSS.from_series(pl.Series(["a", "b"]), {1: "One"})
+    with pytest.raises(TypeError):
+        LabelledSPSS.from_series(pl.Series([True, False]))
+
+
 def test_printed_output_is_stable():
     """String representation should be consistent"""
     x = labelled_spss(
@@ -117,6 +134,13 @@ def test_values_in_na_values_flagged_as_missing():
     assert missing == expected
 
 
+def test_na_values_exact_for_large_integers():
+    """Integer codes above 2**53 must not collide through a float view"""
+    x = labelled_spss([2**53 + 1, 2**53], na_values=[2**53])
+
+    assert x.is_na() == [False, True]
+
+
 # Combining / concatenation tests ----------------------------------------
 
 
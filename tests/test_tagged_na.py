@@ -47,3 +47,47 @@ def test_print_tagged_na_snapshot_stability():
     assert lines[0].endswith("1")
     assert "NA(a)" in out and "NA(b)" in out and "NA(c)" in out
     assert lines[-1].strip() == "NA"
+
+
+def test_hydrate_tagged_na_rows_and_by_value():
+    import polars as pl
+
+    from svy_io.helpers import _hydrate_tagged_na
+
+    df = pl.DataFrame(
+        {"x": [1.0, 2.0, None, -9.0], "y": ["a", ".A", "b", ".B"], "z": [1, 2, 3, 4]}
+    )
+    meta = {
+        "tagged_missings": [
+            {"col": "x", "rows": [0, 99], "tags": ["a", "z"]},  # out-of-range row ignored
+            {"col": "x", "by_value": {-9: "h", 1.0: "q"}},  # row 0 already tagged
+            {"col": "y", "by_value": {".A": "A", ".B": "B"}},
+            {"col": "z", "by_value": {"nope": "n"}},  # no match: column untouched
+        ]
+    }
+    out = _hydrate_tagged_na(df, meta)
+
+    assert na_tag(out["x"].to_list()) == ["a", None, None, "h"]
+    assert out["x"].to_list()[1] == 2.0
+    assert na_tag(out["y"].to_list()) == [None, "A", None, "B"]
+    assert out["z"].dtype == pl.Int64
+    # hydrated cells share the interned instance that tagged_na() hands out
+    assert out["x"].to_list()[0] is tagged_na("a")
+
+
+def test_hydrate_tagged_na_column_mode_keeps_native_dtype():
+    import polars as pl
+    import pytest
+
+    from svy_io.helpers import _hydrate_tagged_na
+
+    df = pl.DataFrame({"x": [1.0, None, None, 4.0]})
+    meta = {"tagged_missings": [{"col": "x", "rows": [1, 2], "tags": ["a", "z"]}]}
+    out = _hydrate_tagged_na(df, meta, mode="column")
+
+    assert out["x"].dtype == pl.Float64
+    assert out["__svy_tag_x"].dtype == pl.Categorical
+    assert out["__svy_tag_x"].to_list() == [None, "a", "z", None]
+
+    with pytest.raises(ValueError):
+        _hydrate_tagged_na(df, meta, mode="bogus")
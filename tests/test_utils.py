@@ -8,9 +8,7 @@ from svy_io import (
     get_column_labels,
     get_value_labels_for_column,
 )
-from svy_io.helpers import (
-    _normalize_n_max,
-)
+from svy_io.helpers import _compile_meta, _normalize_n_max
 
 
 def test_normalize_n_max_variants():
@@ -57,6 +55,36 @@ def test_column_label_helpers():
     assert get_value_labels_for_column(meta, "q1") is None
 
 
+def test_value_labels_for_column_sees_in_place_var_edits():
+    meta = _fake_meta()
+    assert get_value_labels_for_column(meta, "gender") == {"f": "Female", "m": "Male"}
+
+    meta["vars"][0] = {"name": "sex", "label": None, "label_set": "$GENDER", "fmt": None}
+    assert get_value_labels_for_column(meta, "sex") == {"f": "Female", "m": "Male"}
+    assert get_value_labels_for_column(meta, "gender") is None
+
+
+def test_value_labels_for_column_with_compiled_meta():
+    meta = _fake_meta()
+    keys = set(meta)
+    compiled = _compile_meta(meta)
+    for name in ("gender", "q1", "age", "missing"):
+        expected = get_value_labels_for_column(meta, name)
+        assert get_value_labels_for_column(meta, name, compiled=compiled) == expected
+    assert set(meta) == keys
+
+
+def test_value_labels_for_column_sees_in_place_set_edits():
+    meta = _fake_meta()
+    keys = set(meta)
+    assert get_value_labels_for_column(meta, "gender") == {"f": "Female", "m": "Male"}
+
+    meta["value_labels"][0]["mapping"] = {"f": "F"}
+    assert get_value_labels_for_column(meta, "gender") == {"f": "F"}
+    # nothing private is stashed in the caller's meta
+    assert set(meta) == keys
+
+
 def test_as_factor_default_and_modes():
     meta = _fake_meta()
     s = pl.Series("gender", ["f", "m", "f", None])
@@ -77,6 +105,31 @@ def test_as_factor_default_and_modes():
     assert out_both.to_list()[:2] == ["[f] Female", "[m] Male"]
 
 
+def test_as_factor_bool_and_float_keep_python_rendering():
+    b = pl.Series("b", [True, False, None])
+    assert as_factor(b, {True: "TT"}).to_list() == ["TT", "False", None]
+    assert as_factor(b, {"true": "x"}, levels="labels").to_list() == [None, None, None]
+
+    f = pl.Series("f", [1e-7, 2.0])
+    assert as_factor(f, {2: "two"}, levels="both").to_list() == ["1e-07", "[2.0] two"]
+
+
+def test_as_factor_uint64_beyond_int64_falls_back_to_str():
+    u = pl.Series("u", [1, 2**63 + 5], dtype=pl.UInt64)
+    assert as_factor(u, {1: "one"}).to_list() == ["one", str(2**63 + 5)]
+    assert as_factor(u, {str(2**63 + 5): "big"}, levels="labels").to_list() == [None, "big"]
+
+
+def test_as_factor_object_column_matches_string_keys():
+    # Object columns (e.g. hydrated tagged NAs) fall back to str(value) lookups
+    s = pl.Series("q", [1, 2, None], dtype=pl.Object)
+    mapping = {"1": "Yes", "2": "No"}
+
+    assert as_factor(s, mapping, levels="labels").to_list() == ["Yes", "No", None]
+    assert as_factor(s, mapping, levels="both").to_list() == ["[1] Yes", "[2] No", None]
+    assert as_factor(s, mapping).to_list() == ["Yes", "No", None]
+
+
 def test_apply_value_labels_dataframe():
     meta = _fake_meta()
     df = pl.DataFrame(
@@ -178,6 +178,16 @@ def test_zap_missing_converts_special_missings():
     # (exact behavior may vary; adjust once implemented)
 
 
+def test_zap_missing_lazyframe_stays_lazy():
+    lf = pl.DataFrame({"x": [1, 2, 99], "y": [1.0, float("nan"), 3.0]}).lazy()
+    meta = {"user_missing": [{"col": "x", "na_values": [99]}]}
+    out = zap_missing(lf, meta)
+    assert isinstance(out, pl.LazyFrame)
+    got = out.collect()
+    assert got["x"].to_list() == [1, 2, None]
+    assert got["y"].to_list() == [1.0, None, 3.0]
+
+
 # ---------- zap_widths ----------
 
 
@@ -221,6 +231,19 @@ def test_zap_empty_replaces_empty_strings_with_none():
     assert out == [None, "a", None]
 
 
+def test_zap_empty_lazyframe_stays_lazy():
+    lf = pl.DataFrame({"s": ["", "a", None], "n": [1, 2, 3]}).lazy()
+    out = zap_empty(lf)
+    assert isinstance(out, pl.LazyFrame)
+    assert out.collect()["s"].to_list() == [None, "a", None]
+
+
+def test_zap_empty_series_keeps_name():
+    out = zap_empty(pl.Series("s", ["", "a", None]))
+    assert out.name == "s"
+    assert out.to_list() == [None, "a", None]
+
+
 # ---- Added test
 def test_zap_missing_converts_tagged_na_in_series():
     df = pl.DataFrame({"x": [1.0, tagged_na("a"), 3.0]}, strict=False)